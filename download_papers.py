@@ -16,11 +16,10 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 # Fix Windows encoding issues with special characters
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -33,36 +32,46 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.paper_fetcher import Paper
+from src.paper_corpus import PaperCorpus
+from src.paper_fetcher import Paper, iter_saved_papers
+from src.paper_io import read_jsonl_header
+from src.paper_store import SQLITE_SUFFIXES, PaperStore
+from src import columnar, json_codec
+from src.dedup_index import DedupIndex
 from src.pdf_downloader import PDFDownloader, DownloadResult
+from src.negative_cache import NegativeCache
+from src.source_router import SourceRouter
 
 
 def load_papers_from_json(filepath: str) -> tuple[dict, list[Paper]]:
     """Load papers from JSON file without requiring API key.
 
+    JSONL files (``.jsonl``) are read one record at a time. A SQLite
+    paper store (``.db``/``.sqlite``) loads its latest query run, and
+    Parquet/Arrow files are read with pyarrow.
+
     Args:
-        filepath: Path to JSON file.
+        filepath: Path to JSON/JSONL file or paper store database.
 
     Returns:
         Tuple of (metadata dict, list of Papers).
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    papers = []
-    for p in data.get("papers", []):
-        papers.append(Paper(
-            scopus_id=p["scopus_id"],
-            title=p["title"],
-            abstract=p["abstract"],
-            authors=p["authors"],
-            publication_name=p["publication_name"],
-            publication_date=p["publication_date"],
-            citation_count=p["citation_count"],
-            doi=p.get("doi"),
-            keywords=p.get("keywords", []),
-            url=p.get("url"),
-        ))
+    if Path(filepath).suffix in SQLITE_SUFFIXES:
+        with PaperStore(filepath) as store:
+            return store.load_run()
+
+    if Path(filepath).suffix in columnar.COLUMNAR_SUFFIXES:
+        return columnar.load_papers(filepath)
+
+    if Path(filepath).suffix == ".jsonl":
+        metadata = read_jsonl_header(filepath)
+        papers = list(iter_saved_papers(filepath))
+        metadata["count"] = len(papers)
+        return metadata, papers
+
+    data = json_codec.load_file(filepath)
+
+    papers = [Paper.from_dict(p) for p in data.get("papers", [])]
 
     metadata = {
         "query": data.get("query"),
@@ -73,6 +82,25 @@ def load_papers_from_json(filepath: str) -> tuple[dict, list[Paper]]:
     return metadata, papers
 
 
+def open_papers(filepath: str) -> tuple[dict, Sequence[Paper]]:
+    """Open papers for listing and selection without decoding all of them.
+
+    JSON and JSONL files are opened as a memory-mapped PaperCorpus, so only
+    the papers that are listed or selected get decoded. Other formats are
+    loaded with load_papers_from_json.
+
+    Args:
+        filepath: Path to a saved papers file.
+
+    Returns:
+        Tuple of (metadata dict, sequence of Papers).
+    """
+    if Path(filepath).suffix in (".json", ".jsonl"):
+        corpus = PaperCorpus(filepath)
+        return corpus.metadata, corpus
+    return load_papers_from_json(filepath)
+
+
 def get_latest_papers_file(data_dir: str = "data/papers") -> Optional[Path]:
     """Get the most recently created papers file.
 
@@ -86,13 +114,13 @@ def get_latest_papers_file(data_dir: str = "data/papers") -> Optional[Path]:
     if not papers_dir.exists():
         return None
 
-    files = list(papers_dir.glob("papers_*.json"))
+    files = [*papers_dir.glob("papers_*.json"), *papers_dir.glob("papers_*.jsonl")]
     if not files:
         return None
     return max(files, key=lambda f: f.stat().st_mtime)
 
 
-def print_paper_list(papers: list[Paper], show_doi: bool = True) -> None:
+def print_paper_list(papers: Sequence[Paper], show_doi: bool = True) -> None:
     """Print numbered list of papers.
 
     Args:
@@ -154,7 +182,7 @@ def parse_selection(selection_str: str, max_index: int) -> list[int]:
     return sorted(indices)
 
 
-def interactive_select(papers: list[Paper]) -> list[int]:
+def interactive_select(papers: Sequence[Paper]) -> list[int]:
     """Interactively select papers to download.
 
     Args:
@@ -305,7 +333,14 @@ Examples:
         "--delay",
         type=float,
         default=1.0,
-        help="Delay between downloads in seconds (default: 1.0)"
+        help="Delay between downloads in seconds (default: 1.0). With "
+             "--workers > 1, the minimum interval between requests to the same host"
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Number of concurrent downloads, capped per host (default: 1, serial)"
     )
 
     # Source options
@@ -325,6 +360,32 @@ Examples:
         help="Disable Unpaywall API (open access)"
     )
 
+    parser.add_argument(
+        "--hedged",
+        action="store_true",
+        help="Query all sources of a paper at once and keep the first PDF "
+             "(lower latency when a source stalls, more requests)"
+    )
+    parser.add_argument(
+        "--no-routing",
+        action="store_true",
+        help="Try every enabled source for every DOI instead of routing by "
+             "DOI prefix and past success (stats in <output-dir>/source_stats.db)"
+    )
+
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Retry DOI/source pairs that failed recently instead of skipping "
+             "them (failures are kept in <output-dir>/negative_cache.db)"
+    )
+
+    parser.add_argument(
+        "--dedup-index",
+        help="Cross-run dedup index; reuses PDFs already downloaded for the "
+             "same paper under another title (e.g. data/papers/dedup_index.db)"
+    )
+
     # Display options
     parser.add_argument(
         "--list-only",
@@ -345,10 +406,10 @@ Examples:
             print("Error: No saved papers found in data/papers/", file=sys.stderr)
             sys.exit(1)
         print(f"Using latest file: {latest_file}", file=sys.stderr)
-        metadata, papers = load_papers_from_json(str(latest_file))
+        metadata, papers = open_papers(str(latest_file))
     else:
         print(f"Loading papers from: {args.load}", file=sys.stderr)
-        metadata, papers = load_papers_from_json(args.load)
+        metadata, papers = open_papers(args.load)
 
     print(f"Loaded {len(papers)} papers", file=sys.stderr)
 
@@ -416,7 +477,17 @@ Examples:
         email=args.email,
         use_elsevier=use_elsevier,
         use_springer=use_springer,
-        use_unpaywall=use_unpaywall
+        use_unpaywall=use_unpaywall,
+        dedup_index=DedupIndex(args.dedup_index) if args.dedup_index else None,
+        max_workers=args.workers,
+        hedged=args.hedged,
+        negative_cache=NegativeCache(
+            str(Path(args.output_dir) / "negative_cache.db"),
+            refresh=args.retry_failed
+        ),
+        router=None if args.no_routing else SourceRouter(
+            str(Path(args.output_dir) / "source_stats.db")
+        )
     )
 
     # Show download sources status
@@ -24,7 +24,11 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.paper_fetcher import PaperFetcher, generate_review_summary
+from src.paper_fetcher import Paper, PaperFetcher, generate_review_summary
+from src import columnar
+from src.dedup_index import DedupIndex
+from src.paper_store import PaperStore
+from src.response_cache import ResponseCache
 from src.query_builder import build_query_from_topic
 
 
@@ -43,6 +47,12 @@ Examples:
   # Use raw Scopus query
   python search_papers.py --query 'TITLE-ABS-KEY("neural network") AND PUBYEAR > 2019'
 
+  # Compare result counts of keyword variants
+  python search_papers.py --count-only -q 'TITLE-ABS-KEY("A")' -q 'TITLE-ABS-KEY("A" OR "B")'
+
+  # Save into a SQLite paper store (deduplicated by Scopus ID)
+  python search_papers.py --topic "machine learning" --store data/papers.db
+
   # Load and review previously saved results
   python search_papers.py --load data/papers/papers_20241201_120000.json
         """
@@ -55,7 +65,8 @@ Examples:
     )
     parser.add_argument(
         "--query", "-q",
-        help="Raw Scopus query string (advanced)"
+        action="append",
+        help="Raw Scopus query string (advanced). May be repeated with --count-only"
     )
     parser.add_argument(
         "--additional", "-a",
@@ -85,6 +96,77 @@ Examples:
         default=30,
         help="Number of papers to fetch (default: 30)"
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Number of concurrent page requests (default: 1, serial)"
+    )
+
+    parser.add_argument(
+        "--fields",
+        help="Paper attributes to request (comma-separated, e.g. "
+             "'title,doi,citation_count'). Smaller responses on bulk harvests; "
+             "omitted attributes are left empty"
+    )
+    parser.add_argument(
+        "--enrich-abstracts",
+        action="store_true",
+        help="Fill in missing or truncated abstracts via the Abstract Retrieval API"
+    )
+    parser.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="Fetch every matching paper by splitting the query into "
+             "PUBYEAR shards (ignores --count)"
+    )
+
+    parser.add_argument(
+        "--count-only",
+        action="store_true",
+        help="Only print the number of matching results for each query"
+    )
+
+    parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="Only fetch papers not seen in earlier runs of the same query"
+    )
+
+    parser.add_argument(
+        "--dedup-index",
+        help="Register fetched papers in this cross-run dedup index "
+             "(e.g. data/papers/dedup_index.db)"
+    )
+    parser.add_argument(
+        "--skip-duplicates",
+        action="store_true",
+        help="Drop papers already in the dedup index (requires --dedup-index)"
+    )
+
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Use memory-compact paper objects (for very large harvests)"
+    )
+
+    # Cache options
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Cache Scopus search pages on disk (default: enabled)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached pages and re-fetch them from Scopus"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default="data/cache",
+        help="Directory for cached search pages (default: data/cache)"
+    )
 
     # Load option
     parser.add_argument(
@@ -102,14 +184,94 @@ Examples:
         action="store_true",
         help="Don't save results to JSON file"
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="json",
+        dest="output_format",
+        help="Saved file format: json (single document) or jsonl "
+             "(append each paper as it is fetched) (default: json)"
+    )
+    parser.add_argument(
+        "--export",
+        help="Also export results to a columnar file for analytics "
+             "(.parquet, .arrow or .feather; requires pyarrow)"
+    )
+    parser.add_argument(
+        "--no-indent",
+        action="store_true",
+        help="Write compact (non-indented) JSON files: smaller and faster to load"
+    )
+    parser.add_argument(
+        "--store",
+        help="Save results to this SQLite paper store instead of a JSON file "
+             "(e.g. data/papers.db)"
+    )
 
     args = parser.parse_args()
 
     # Validate arguments
     if not args.topic and not args.query and not args.load:
         parser.error("One of --topic, --query, or --load is required")
+    if args.query and len(args.query) > 1 and not args.count_only:
+        parser.error("Multiple --query values are only supported with --count-only")
+    if args.skip_duplicates and not args.dedup_index:
+        parser.error("--skip-duplicates requires --dedup-index")
 
-    fetcher = PaperFetcher()
+    additional = args.additional.split(",") if args.additional else None
+    additional_or = args.additional_or.split(",") if args.additional_or else None
+    exclude = args.exclude.split(",") if args.exclude else None
+
+    cache = None
+    if args.cache:
+        cache = ResponseCache(cache_dir=args.cache_dir, refresh=args.refresh)
+
+    paper_fields = None
+    if args.fields:
+        paper_fields = [f.strip() for f in args.fields.split(",")]
+        try:
+            Paper.scopus_projection(paper_fields)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.export:
+        try:
+            columnar.validate_export_path(args.export)
+        except (ValueError, ImportError) as e:
+            parser.error(f"--export: {e}")
+
+    fetcher = PaperFetcher(
+        max_workers=args.workers,
+        cache=cache,
+        paper_fields=paper_fields,
+        enrich=args.enrich_abstracts,
+        store=PaperStore(args.store) if args.store else None,
+        output_format=args.output_format,
+        dedup_index=DedupIndex(args.dedup_index) if args.dedup_index else None,
+        skip_duplicates=args.skip_duplicates,
+        compact=args.compact,
+        json_indent=not args.no_indent
+    )
+
+    if args.count_only:
+        # Probe result counts without fetching papers
+        queries = list(args.query or [])
+        if args.topic:
+            queries.append(build_query_from_topic(
+                topic=args.topic,
+                additional_terms=additional,
+                additional_terms_or=additional_or,
+                exclude=exclude,
+                year_from=args.year_from,
+                year_to=args.year_to
+            ))
+        if not queries:
+            parser.error("--count-only requires --topic or --query")
+
+        counts = fetcher.client.count_many(queries)
+        for query, count in zip(queries, counts):
+            print(f"{count}\t{query}")
+        return
 
     if args.load:
         # Load existing papers
@@ -119,20 +281,30 @@ Examples:
         print(f"Loaded {len(papers)} papers", file=sys.stderr)
     elif args.query:
         # Use raw query
-        print(f"Searching with query: {args.query}", file=sys.stderr)
-        papers = fetcher.fetch_papers(
-            args.query,
-            count=args.count,
-            save=not args.no_save
-        )
-        query = args.query
+        query = args.query[0]
+        print(f"Searching with query: {query}", file=sys.stderr)
+        if args.exhaustive:
+            papers = fetcher.fetch_exhaustive(
+                query,
+                year_from=args.year_from,
+                year_to=args.year_to,
+                save=not args.no_save
+            )
+        elif args.new_only:
+            papers = fetcher.fetch_new_papers(
+                query,
+                count=args.count,
+                save=not args.no_save
+            )
+        else:
+            papers = fetcher.fetch_papers(
+                query,
+                count=args.count,
+                save=not args.no_save
+            )
         print(f"Found {len(papers)} papers", file=sys.stderr)
     else:
         # Build query from topic
-        additional = args.additional.split(",") if args.additional else None
-        additional_or = args.additional_or.split(",") if args.additional_or else None
-        exclude = args.exclude.split(",") if args.exclude else None
-
         query, papers = fetcher.fetch_by_topic(
             topic=args.topic,
             count=args.count,
@@ -141,11 +313,17 @@ Examples:
             exclude=exclude,
             year_from=args.year_from,
             year_to=args.year_to,
-            save=not args.no_save
+            save=not args.no_save,
+            exhaustive=args.exhaustive,
+            new_only=args.new_only
         )
         print(f"Generated query: {query}", file=sys.stderr)
         print(f"Found {len(papers)} papers", file=sys.stderr)
 
+    if args.export:
+        export_path = columnar.export_papers(papers, args.export, query=query)
+        print(f"Exported {len(papers)} papers to: {export_path}", file=sys.stderr)
+
     # Generate review summary
     summary = generate_review_summary(papers, query)
 
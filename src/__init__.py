@@ -1,17 +1,48 @@
 """PaperSearch - Scopus paper search and review framework."""
 
+from .rate_limiter import HostLimiter, RateLimiter
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
 from .scopus_client import ScopusClient
 from .query_builder import QueryBuilder, build_query_from_topic
-from .paper_fetcher import Paper, PaperFetcher, generate_review_summary
+from .query_planner import QueryShard, YearShardPlanner
+from .query_history import QueryHistory
+from .paper_fetcher import Paper, PaperFetcher, generate_review_summary, iter_saved_papers
+from .compact_paper import CompactPaper
+from .paper_corpus import PaperCorpus
+from .paper_store import PaperStore
+from .dedup_index import DedupIndex
+from .columnar import export_papers
+from .source_router import SourceRouter
+from .negative_cache import NegativeCache
 from .pdf_downloader import PDFDownloader, DownloadResult
+from .async_scopus_client import AsyncScopusClient
+from .async_pdf_downloader import AsyncPDFDownloader
 
 __all__ = [
+    "RateLimiter",
+    "HostLimiter",
+    "ResponseCache",
+    "RetryPolicy",
     "ScopusClient",
+    "AsyncScopusClient",
     "QueryBuilder",
     "build_query_from_topic",
+    "QueryShard",
+    "YearShardPlanner",
+    "QueryHistory",
     "Paper",
     "PaperFetcher",
     "generate_review_summary",
+    "iter_saved_papers",
+    "CompactPaper",
+    "PaperCorpus",
+    "PaperStore",
+    "DedupIndex",
+    "export_papers",
+    "SourceRouter",
+    "NegativeCache",
     "PDFDownloader",
     "DownloadResult",
+    "AsyncPDFDownloader",
 ]
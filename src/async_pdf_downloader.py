@@ -0,0 +1,498 @@
+"""Asyncio PDF downloader built on aiohttp."""
+
+import asyncio
+import contextvars
+import os
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .dedup_index import DedupIndex
+from .negative_cache import failure_class
+from .paper_fetcher import Paper
+from .pdf_downloader import SOURCE_LABELS, DownloadResult, PDFDownloader
+from .rate_limiter import DEFAULT_HOST_LIMITS, RateLimiter
+from .retry import RetryPolicy
+from .source_router import SourceRouter
+
+# Failure class of the current task's last request (asyncio counterpart of
+# PDFDownloader's thread-local failure), reported to the router
+_failure: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "pdf_download_failure", default=None
+)
+
+
+class AsyncPDFDownloader:
+    """Asyncio counterpart of PDFDownloader.
+
+    Runs the same Elsevier -> Springer -> Unpaywall cascade as
+    ``PDFDownloader.download_paper`` as coroutines and returns the same
+    DownloadResult objects. Response bodies are streamed to disk chunk by
+    chunk, with file writes run off the event loop. A semaphore bounds the
+    number of papers in flight and per-host semaphores (DEFAULT_HOST_LIMITS)
+    cap connections to each server, so thousands of DOIs can be processed
+    from one process without a thread per download. Requires ``aiohttp``.
+
+    Example:
+        async with AsyncPDFDownloader(max_concurrency=32) as downloader:
+            results = await downloader.download_papers(papers)
+    """
+
+    ELSEVIER_API = PDFDownloader.ELSEVIER_API
+    SPRINGER_META_API = PDFDownloader.SPRINGER_META_API
+    SPRINGER_PDF_BASE = PDFDownloader.SPRINGER_PDF_BASE
+    UNPAYWALL_API = PDFDownloader.UNPAYWALL_API
+
+    CHUNK_SIZE = 65536
+
+    sanitize_filename = PDFDownloader.sanitize_filename
+    pdf_path = PDFDownloader.pdf_path
+    get_download_stats = PDFDownloader.get_download_stats
+    enabled_sources = PDFDownloader.enabled_sources
+    source_order = PDFDownloader.source_order
+
+    def __init__(
+        self,
+        download_dir: str = "data/pdfs",
+        api_key: Optional[str] = None,
+        springer_api_key: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: float = 60,
+        use_elsevier: bool = True,
+        use_springer: bool = True,
+        use_unpaywall: bool = True,
+        max_concurrency: int = 16,
+        max_per_host: int = 2,
+        host_limits: Optional[dict[str, int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        dedup_index: Optional[DedupIndex] = None,
+        router: Optional[SourceRouter] = None
+    ):
+        """Initialize async PDF downloader.
+
+        Args:
+            download_dir: Directory to save downloaded PDFs.
+            api_key: Elsevier API key (uses SCOPUS_API_KEY env var if not provided).
+            springer_api_key: Springer Meta API key (uses SPRINGER_META_API_KEY env var if not provided).
+            email: Email for Unpaywall API (required for API access).
+            timeout: Connect and read timeout in seconds.
+            use_elsevier: Whether to try Elsevier API first.
+            use_springer: Whether to try Springer API.
+            use_unpaywall: Whether to use Unpaywall as fallback.
+            max_concurrency: Maximum number of papers downloaded at once.
+            max_per_host: Concurrent requests for hosts not in host_limits.
+            host_limits: Per-host overrides, merged into DEFAULT_HOST_LIMITS.
+            rate_limiter: Limiter for Elsevier API calls. Share it with
+                AsyncScopusClient when both use the same API key.
+            retry_policy: Retry policy for transient failures (429/5xx,
+                connection errors). Defaults to RetryPolicy().
+            dedup_index: Optional cross-run dedup index (see PDFDownloader).
+            router: Optional SourceRouter (see PDFDownloader).
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncPDFDownloader requires aiohttp. Install it with: pip install aiohttp"
+            )
+
+        self.download_dir = Path(download_dir)
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+
+        self.api_key = api_key or os.environ.get("SCOPUS_API_KEY")
+        self.springer_api_key = springer_api_key or os.environ.get("SPRINGER_META_API_KEY")
+        self.email = email or os.environ.get("UNPAYWALL_EMAIL", "user@example.com")
+        self.timeout = timeout
+        self.use_elsevier = use_elsevier and bool(self.api_key)
+        self.use_springer = use_springer and bool(self.springer_api_key)
+        self.use_unpaywall = use_unpaywall
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self.host_limits = {**DEFAULT_HOST_LIMITS, **(host_limits or {})}
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.dedup_index = dedup_index
+        self.router = router
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": "PaperSearch/1.0 (Academic Research Tool)"},
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.timeout,
+                    sock_read=self.timeout
+                ),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+            )
+        return self._session
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore capping concurrent requests to the URL's host."""
+        host = urlparse(url).hostname or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.host_limits.get(host, self.max_per_host))
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncPDFDownloader":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _get(
+        self,
+        url: str,
+        rate_limited: bool = False,
+        **kwargs
+    ) -> "aiohttp.ClientResponse":
+        """Send a GET request with retries.
+
+        The caller must release the returned response (``async with``).
+
+        Args:
+            url: Request URL.
+            rate_limited: Whether to draw from the Elsevier rate limiter.
+            **kwargs: Extra arguments for aiohttp.ClientSession.get.
+
+        Returns:
+            Response of the last attempt.
+        """
+        session = self._get_session()
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if rate_limited:
+                await self.rate_limiter.acquire_async()
+            try:
+                response = await session.get(url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = policy.next_delay(attempt, started)
+                if delay is None:
+                    _failure.set("timeout" if isinstance(e, asyncio.TimeoutError) else "error")
+                    raise
+            else:
+                if rate_limited:
+                    self.rate_limiter.update(response)
+                _failure.set(failure_class(response.status))
+                if response.status not in policy.retry_statuses:
+                    return response
+                delay = policy.next_delay(attempt, started, response)
+                if delay is None:
+                    return response
+                response.release()
+
+            await asyncio.sleep(delay)
+
+    async def _save_pdf(
+        self,
+        response: "aiohttp.ClientResponse",
+        filepath: Path,
+        content_types: tuple[str, ...] = ("pdf", "octet-stream")
+    ) -> bool:
+        """Stream a PDF response body to disk.
+
+        The body is accepted if the Content-Type matches one of
+        content_types or the body starts with the ``%PDF`` magic bytes.
+        Files of 1000 bytes or less are discarded.
+
+        Args:
+            response: Response with status 200.
+            filepath: Path to save the PDF.
+            content_types: Accepted Content-Type substrings.
+
+        Returns:
+            True if a PDF was saved.
+        """
+        content_type = response.headers.get("Content-Type", "").lower()
+        first_bytes = b""
+        if not any(t in content_type for t in content_types):
+            first_bytes = await response.content.read(8)
+            if not first_bytes.startswith(b"%PDF"):
+                return False
+
+        f = await asyncio.to_thread(open, filepath, "wb")
+        try:
+            if first_bytes:
+                await asyncio.to_thread(f.write, first_bytes)
+            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+
+        if filepath.stat().st_size > 1000:
+            return True
+        filepath.unlink()
+        return False
+
+    async def _download_to(
+        self,
+        url: str,
+        filepath: Path,
+        content_types: tuple[str, ...] = ("pdf", "octet-stream"),
+        rate_limited: bool = False,
+        **kwargs
+    ) -> bool:
+        """Download a PDF URL to filepath within the host's slot."""
+        try:
+            async with self._host_slot(url):
+                response = await self._get(
+                    url, rate_limited=rate_limited, allow_redirects=True, **kwargs
+                )
+                async with response:
+                    if response.status != 200:
+                        return False
+                    return await self._save_pdf(response, filepath, content_types)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _failure.set("timeout" if isinstance(e, asyncio.TimeoutError) else "error")
+            if filepath.exists():
+                filepath.unlink()
+            return False
+
+    async def _get_json(self, url: str, params: dict) -> Optional[dict]:
+        """GET a JSON document within the host's slot.
+
+        Returns:
+            Decoded JSON, or None on a non-200 status or request error.
+        """
+        try:
+            async with self._host_slot(url):
+                response = await self._get(url, params=params)
+                async with response:
+                    if response.status != 200:
+                        return None
+                    return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
+
+    async def download_from_elsevier(self, doi: str, filepath: Path) -> Optional[str]:
+        """Download PDF from Elsevier ScienceDirect API.
+
+        Args:
+            doi: Digital Object Identifier.
+            filepath: Path to save the PDF.
+
+        Returns:
+            Source string if successful, None otherwise.
+        """
+        if not self.api_key:
+            return None
+
+        headers = {
+            "X-ELS-APIKey": self.api_key,
+            "Accept": "application/pdf"
+        }
+        url = f"{self.ELSEVIER_API}/{doi}"
+        if await self._download_to(url, filepath, rate_limited=True, headers=headers):
+            return "elsevier"
+        return None
+
+    async def get_springer_pdf_url(self, doi: str) -> Optional[dict]:
+        """Get PDF URL from Springer Meta API (see PDFDownloader.get_springer_pdf_url)."""
+        if not self.springer_api_key or not doi:
+            return None
+
+        params = {
+            "api_key": self.springer_api_key,
+            "q": f"doi:{doi}",
+            "p": 1
+        }
+        data = await self._get_json(self.SPRINGER_META_API, params)
+        if not data or not data.get("records"):
+            return None
+
+        record = data["records"][0]
+        if "springer" not in record.get("publisher", "").lower():
+            return None
+
+        pdf_url = next(
+            (u.get("value") for u in record.get("url", []) if u.get("format") == "pdf"),
+            None
+        ) or f"{self.SPRINGER_PDF_BASE}/{doi}.pdf"
+
+        return {
+            "pdf_url": pdf_url,
+            "publisher": record.get("publisherName", "Springer"),
+            "openaccess": record.get("openaccess", "false") == "true",
+            "title": record.get("title", "")
+        }
+
+    async def download_from_springer(self, doi: str, filepath: Path) -> Optional[str]:
+        """Download PDF from Springer using Meta API.
+
+        Args:
+            doi: Digital Object Identifier.
+            filepath: Path to save the PDF.
+
+        Returns:
+            Source string if successful, None otherwise.
+        """
+        if not await self.get_springer_pdf_url(doi):
+            return None
+
+        # Direct PDF URL pattern (more reliable than the Meta API URL)
+        pdf_url = f"{self.SPRINGER_PDF_BASE}/{doi}.pdf"
+        if await self._download_to(pdf_url, filepath, content_types=("pdf",)):
+            return "springer"
+        return None
+
+    async def get_unpaywall_pdf_url(self, doi: str) -> Optional[dict]:
+        """Get PDF URL from Unpaywall API (see PDFDownloader.get_unpaywall_pdf_url)."""
+        if not doi:
+            return None
+
+        data = await self._get_json(f"{self.UNPAYWALL_API}/{doi}", {"email": self.email})
+        if not data:
+            return None
+
+        locations = [data.get("best_oa_location")] + data.get("oa_locations", [])
+        for location in locations:
+            if location and location.get("url_for_pdf"):
+                return {
+                    "pdf_url": location["url_for_pdf"],
+                    "source": location.get("host_type", "unknown"),
+                    "version": location.get("version", "unknown"),
+                    "license": location.get("license", "unknown")
+                }
+        return None
+
+    async def download_pdf(self, url: str, filepath: Path) -> bool:
+        """Download PDF from URL.
+
+        Args:
+            url: URL to download from.
+            filepath: Path to save the PDF.
+
+        Returns:
+            True if download succeeded, False otherwise.
+        """
+        return await self._download_to(url, filepath)
+
+    async def download_paper(self, paper: Paper, filename: Optional[str] = None) -> DownloadResult:
+        """Download PDF for a single paper (see PDFDownloader.download_paper).
+
+        Args:
+            paper: Paper object with metadata.
+            filename: Optional custom filename (without extension).
+
+        Returns:
+            DownloadResult with success status and file path.
+        """
+        if not paper.doi:
+            return DownloadResult(
+                paper=paper,
+                success=False,
+                error="No DOI available"
+            )
+
+        if self.dedup_index is not None:
+            existing = self.dedup_index.get_pdf_path(paper)
+            if existing is not None:
+                return DownloadResult(
+                    paper=paper,
+                    success=True,
+                    filepath=existing,
+                    source="cached"
+                )
+
+        result = await self._download_paper(paper, filename)
+
+        if result.success and self.dedup_index is not None:
+            self.dedup_index.set_pdf_path(paper, result.filepath)
+
+        return result
+
+    async def _download_paper(self, paper: Paper, filename: Optional[str]) -> DownloadResult:
+        """Download a paper with a DOI through the source cascade."""
+        filepath = self.pdf_path(paper, filename)
+
+        if filepath.exists():
+            return DownloadResult(paper=paper, success=True, filepath=filepath, source="cached")
+
+        sources_tried = []
+        for name in self.source_order(paper.doi):
+            _failure.set(None)
+            source = await self._try_source(name, paper.doi, filepath)
+            sources_tried.append(SOURCE_LABELS[name])
+            if self.router is not None:
+                self.router.record(
+                    paper.doi, name, source is not None, _failure.get() or "unavailable"
+                )
+            if source:
+                return DownloadResult(paper=paper, success=True, filepath=filepath, source=source)
+
+        error_msg = "PDF not available"
+        if sources_tried:
+            error_msg = f"PDF not available via {', '.join(sources_tried)}"
+
+        return DownloadResult(paper=paper, success=False, error=error_msg)
+
+    async def _try_source(self, name: str, doi: str, filepath: Path) -> Optional[str]:
+        """Try one source of the cascade (see PDFDownloader._try_source)."""
+        if name == "elsevier":
+            return await self.download_from_elsevier(doi, filepath)
+        if name == "springer":
+            return await self.download_from_springer(doi, filepath)
+
+        unpaywall_result = await self.get_unpaywall_pdf_url(doi)
+        if unpaywall_result and await self.download_pdf(unpaywall_result["pdf_url"], filepath):
+            return f"unpaywall:{unpaywall_result['source']}"
+        return None
+
+    async def download_papers(
+        self,
+        papers: list[Paper],
+        progress_callback: callable = None
+    ) -> list[DownloadResult]:
+        """Download PDFs for multiple papers concurrently.
+
+        At most max_concurrency papers are in flight. progress_callback is
+        called as papers finish, which may differ from input order.
+
+        Args:
+            papers: List of Paper objects.
+            progress_callback: Optional callback function(current, total, paper, result).
+
+        Returns:
+            List of DownloadResult objects, in the order of papers.
+        """
+        # Papers saved to the same file run in input order in one task
+        groups: dict[Path, list[int]] = {}
+        for i, paper in enumerate(papers):
+            groups.setdefault(self.pdf_path(paper), []).append(i)
+
+        results: list[Optional[DownloadResult]] = [None] * len(papers)
+        total = len(papers)
+        done = 0
+
+        async def run(indices: list[int]) -> None:
+            nonlocal done
+            for i in indices:
+                async with self._semaphore:
+                    result = await self.download_paper(papers[i])
+                results[i] = result
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, papers[i], result)
+
+        await asyncio.gather(*(run(indices) for indices in groups.values()))
+        return results
@@ -0,0 +1,265 @@
+"""Asyncio Scopus API client built on aiohttp."""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .paper_fetcher import Paper
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .scopus_client import ScopusClient
+
+
+class AsyncScopusClient:
+    """Asyncio counterpart of ScopusClient.
+
+    Mirrors ``search``, ``search_all`` and ``get_abstract`` with the same
+    request parameters and pagination rules, so results match the
+    synchronous client. A semaphore bounds the number of in-flight requests
+    across every coroutine sharing the client, and every request draws from
+    the same adaptive RateLimiter as the synchronous client. Requires
+    ``aiohttp``.
+
+    Example:
+        async with AsyncScopusClient(max_concurrency=16) as client:
+            papers = await client.fetch_papers(query, count=200)
+    """
+
+    BASE_URL = ScopusClient.BASE_URL
+    ABSTRACT_URL = ScopusClient.ABSTRACT_URL
+    PAGE_SIZE = ScopusClient.PAGE_SIZE
+    MAX_START_OFFSET = ScopusClient.MAX_START_OFFSET
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 8,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        view: str = "COMPLETE",
+        fields: Optional[str] = None,
+        timeout: float = 30
+    ):
+        """Initialize async Scopus client.
+
+        Args:
+            api_key: Scopus API key. If not provided, reads from SCOPUS_API_KEY env var.
+            max_concurrency: Maximum number of requests in flight at once.
+            rate_limiter: Shared rate limiter. Pass the same instance to
+                ScopusClient / PDFDownloader when they use the same API key.
+            retry_policy: Retry policy for transient failures (429/5xx,
+                connection errors). Defaults to RetryPolicy().
+            view: Default Scopus view for search requests.
+            fields: Default comma-separated Scopus ``field`` projection.
+            timeout: Request timeout in seconds.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncScopusClient requires aiohttp. Install it with: pip install aiohttp"
+            )
+
+        self.api_key = api_key or os.environ.get("SCOPUS_API_KEY")
+        if not self.api_key:
+            raise ValueError(
+                "Scopus API key is required. "
+                "Set SCOPUS_API_KEY environment variable or pass api_key parameter."
+            )
+
+        self.headers = {
+            "X-ELS-APIKey": self.api_key,
+            "Accept": "application/json"
+        }
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.view = view
+        self.fields = fields
+        self.timeout = timeout
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncScopusClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _get(self, url: str, params: dict) -> dict:
+        """Send a retried GET request and decode the JSON body.
+
+        Args:
+            url: Request URL.
+            params: Query parameters.
+
+        Returns:
+            Decoded JSON response.
+        """
+        session = self._get_session()
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            async with self._semaphore:
+                await self.rate_limiter.acquire_async()
+                try:
+                    async with session.get(url, params=params) as response:
+                        self.rate_limiter.update(response)
+                        if response.status not in policy.retry_statuses:
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+                        delay = policy.next_delay(attempt, started, response)
+                        if delay is None:
+                            response.raise_for_status()
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    delay = policy.next_delay(attempt, started)
+                    if delay is None:
+                        raise
+
+            await asyncio.sleep(delay)
+
+    async def search(
+        self,
+        query: str,
+        count: int = 25,
+        start: int = 0,
+        sort: str = "-citedby-count",
+        cursor: Optional[str] = None,
+        view: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> dict:
+        """Search Scopus for papers matching query (see ScopusClient.search).
+
+        Returns:
+            Search results as dictionary.
+        """
+        params = {
+            "query": query,
+            "count": min(count, self.PAGE_SIZE),
+            "sort": sort,
+            "view": view or self.view
+        }
+        fields = fields or self.fields
+        if fields:
+            params["field"] = fields
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["start"] = start
+
+        return await self._get(self.BASE_URL, params)
+
+    async def get_abstract(self, scopus_id: str) -> dict:
+        """Get full abstract for a paper by Scopus ID.
+
+        Args:
+            scopus_id: Scopus ID of the paper.
+
+        Returns:
+            Abstract data as dictionary.
+        """
+        url = f"{self.ABSTRACT_URL}/{scopus_id}"
+        return await self._get(url, {"view": "FULL"})
+
+    async def search_all(self, query: str, total_count: int = 100) -> list[dict]:
+        """Search and retrieve multiple pages of results.
+
+        After the first page, the remaining offsets are requested
+        concurrently (bounded by max_concurrency) and reassembled in order.
+        Requests beyond MAX_START_OFFSET use serial cursor pagination.
+
+        Args:
+            query: Scopus search query string.
+            total_count: Total number of results to retrieve.
+
+        Returns:
+            List of all search result entries.
+        """
+        if total_count > self.MAX_START_OFFSET:
+            return await self._search_cursor(query, total_count)
+
+        first_count = min(self.PAGE_SIZE, total_count)
+        if first_count <= 0:
+            return []
+
+        result = await self.search(query, count=first_count, start=0)
+        entries = result.get("search-results", {}).get("entry", [])
+        if not entries:
+            return []
+
+        all_results = list(entries)
+        total_available = int(
+            result.get("search-results", {}).get("opensearch:totalResults", 0)
+        )
+        target = min(total_count, total_available)
+
+        pages = await asyncio.gather(*(
+            self.search(query, count=min(self.PAGE_SIZE, target - start), start=start)
+            for start in range(len(all_results), target, self.PAGE_SIZE)
+        ))
+        for page in pages:
+            page_entries = page.get("search-results", {}).get("entry", [])
+            if not page_entries:
+                break
+            all_results.extend(page_entries)
+
+        return all_results[:total_count]
+
+    async def _search_cursor(self, query: str, total_count: int) -> list[dict]:
+        """Retrieve results with cursor pagination (see ScopusClient.search_cursor)."""
+        all_results = []
+        cursor = "*"
+
+        while len(all_results) < total_count:
+            count = min(self.PAGE_SIZE, total_count - len(all_results))
+            result = await self.search(query, count=count, cursor=cursor)
+            search_results = result.get("search-results", {})
+            entries = search_results.get("entry", [])
+
+            if not entries:
+                break
+            all_results.extend(entries)
+
+            next_cursor = search_results.get("cursor", {}).get("@next")
+            total_available = int(search_results.get("opensearch:totalResults", 0))
+            if not next_cursor or next_cursor == cursor or len(all_results) >= total_available:
+                break
+            cursor = next_cursor
+
+        return all_results[:total_count]
+
+    async def fetch_papers(self, query: str, count: int = 50) -> list[Paper]:
+        """Fetch papers matching query.
+
+        Args:
+            query: Scopus search query.
+            count: Number of papers to fetch.
+
+        Returns:
+            List of Paper objects.
+        """
+        entries = await self.search_all(query, total_count=count)
+        return [Paper.from_scopus_entry(entry) for entry in entries]
@@ -0,0 +1,199 @@
+"""Columnar (Parquet / Arrow IPC) export and loading of paper collections.
+
+Requires ``pyarrow``. Authors and keywords are stored as list columns,
+citation counts and publication years as integer columns, and the query
+metadata as schema metadata. Analytics jobs can read just the columns they
+need, e.g. ``load_table(path, columns=["year", "citation_count"])``, and
+Arrow IPC files (``.arrow``/``.feather``) are memory-mapped on read.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+from .paper_fetcher import Paper, parse_year
+
+# File suffixes handled by this module
+COLUMNAR_SUFFIXES = (".parquet", ".arrow", ".feather")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Columnar export requires pyarrow. Install it with: pip install pyarrow"
+        )
+
+
+def validate_export_path(filepath: Union[str, Path]) -> Path:
+    """Check that papers can be exported to filepath before fetching them.
+
+    Args:
+        filepath: Output path; the suffix selects the format.
+
+    Returns:
+        filepath as a Path.
+
+    Raises:
+        ValueError: If the suffix is not a supported columnar format.
+        ImportError: If pyarrow is not installed.
+    """
+    filepath = Path(filepath)
+    if filepath.suffix not in COLUMNAR_SUFFIXES:
+        raise ValueError(
+            f"Unsupported columnar format: {filepath.suffix} "
+            f"(use one of {', '.join(COLUMNAR_SUFFIXES)})"
+        )
+    _require_pyarrow()
+    return filepath
+
+
+def paper_schema() -> "pa.Schema":
+    """Get the Arrow schema used for paper collections."""
+    _require_pyarrow()
+    return pa.schema([
+        ("scopus_id", pa.string()),
+        ("title", pa.string()),
+        ("abstract", pa.string()),
+        ("authors", pa.list_(pa.string())),
+        ("publication_name", pa.dictionary(pa.int32(), pa.string())),
+        ("publication_date", pa.string()),
+        ("year", pa.int16()),
+        ("citation_count", pa.int32()),
+        ("doi", pa.string()),
+        ("keywords", pa.list_(pa.string())),
+        ("url", pa.string()),
+    ])
+
+
+def papers_to_table(
+    papers: Iterable[Paper],
+    query: Optional[str] = None,
+    fetched_at: Optional[str] = None
+) -> "pa.Table":
+    """Convert papers to an Arrow table.
+
+    Args:
+        papers: Paper (or CompactPaper) objects.
+        query: Query used to fetch the papers (stored as metadata).
+        fetched_at: ISO timestamp of the fetch (defaults to now).
+
+    Returns:
+        Arrow table with one row per paper.
+    """
+    _require_pyarrow()
+    columns = {name: [] for name in paper_schema().names}
+    for p in papers:
+        columns["scopus_id"].append(p.scopus_id)
+        columns["title"].append(p.title)
+        columns["abstract"].append(p.abstract)
+        columns["authors"].append(list(p.authors))
+        columns["publication_name"].append(p.publication_name)
+        columns["publication_date"].append(p.publication_date)
+        columns["year"].append(parse_year(p.publication_date))
+        columns["citation_count"].append(p.citation_count)
+        columns["doi"].append(p.doi)
+        columns["keywords"].append(list(p.keywords))
+        columns["url"].append(p.url)
+
+    metadata = {
+        "query": query or "",
+        "fetched_at": fetched_at or datetime.now().isoformat(),
+    }
+    return pa.table(columns, schema=paper_schema().with_metadata(metadata))
+
+
+def export_papers(
+    papers: Iterable[Paper],
+    filepath: Union[str, Path],
+    query: Optional[str] = None,
+    fetched_at: Optional[str] = None
+) -> Path:
+    """Write papers to a Parquet (``.parquet``) or Arrow IPC (``.arrow``/``.feather``) file.
+
+    Args:
+        papers: Paper (or CompactPaper) objects.
+        filepath: Output path; the suffix selects the format.
+        query: Query used to fetch the papers.
+        fetched_at: ISO timestamp of the fetch (defaults to now).
+
+    Returns:
+        Path to the written file.
+
+    Raises:
+        ValueError: If the suffix is not a supported columnar format.
+        ImportError: If pyarrow is not installed.
+    """
+    filepath = validate_export_path(filepath)
+
+    table = papers_to_table(papers, query=query, fetched_at=fetched_at)
+    if filepath.suffix == ".parquet":
+        pq.write_table(table, filepath, compression="zstd")
+    else:
+        feather.write_feather(table, filepath, compression="uncompressed")
+    return filepath
+
+
+def load_table(
+    filepath: Union[str, Path],
+    columns: Optional[list[str]] = None
+) -> "pa.Table":
+    """Read a columnar paper file, optionally only some columns.
+
+    Args:
+        filepath: Path to a ``.parquet``, ``.arrow`` or ``.feather`` file.
+        columns: Columns to read (None reads all).
+
+    Returns:
+        Arrow table. Convert with ``.to_pandas()`` for analysis.
+    """
+    _require_pyarrow()
+    filepath = Path(filepath)
+    if filepath.suffix == ".parquet":
+        return pq.read_table(filepath, columns=columns, memory_map=True)
+    return feather.read_table(filepath, columns=columns, memory_map=True)
+
+
+def load_papers(filepath: Union[str, Path]) -> tuple[dict, list[Paper]]:
+    """Load papers from a columnar file.
+
+    Args:
+        filepath: Path to a ``.parquet``, ``.arrow`` or ``.feather`` file.
+
+    Returns:
+        Tuple of (metadata dict, list of Papers), like PaperFetcher.load_papers.
+    """
+    table = load_table(filepath)
+    schema_metadata = {
+        k.decode("utf-8"): v.decode("utf-8")
+        for k, v in (table.schema.metadata or {}).items()
+    }
+
+    papers = [
+        Paper(
+            scopus_id=row["scopus_id"],
+            title=row["title"],
+            abstract=row["abstract"],
+            authors=row["authors"] or [],
+            publication_name=row["publication_name"],
+            publication_date=row["publication_date"],
+            citation_count=row["citation_count"],
+            doi=row["doi"],
+            keywords=row["keywords"] or [],
+            url=row["url"],
+        )
+        for row in table.drop_columns(["year"]).to_pylist()
+    ]
+
+    metadata = {
+        "query": schema_metadata.get("query"),
+        "fetched_at": schema_metadata.get("fetched_at"),
+        "count": len(papers),
+    }
+    return metadata, papers
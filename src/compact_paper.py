@@ -0,0 +1,118 @@
+"""Memory-compact paper representation for large corpora."""
+
+import sys
+from typing import Iterable, Optional
+
+from .paper_fetcher import Paper, parse_scopus_entry
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _intern_all(values: Optional[Iterable[str]]) -> tuple[str, ...]:
+    return tuple(sys.intern(v) for v in values) if values else ()
+
+
+class CompactPaper:
+    """Slotted, memory-compact counterpart of Paper.
+
+    Instances have no per-instance ``__dict__``; authors and keywords are
+    tuples, and strings that repeat across a corpus (publication name,
+    publication date, author names, keywords) are interned so each distinct
+    value is stored once. The attribute names, to_dict, from_dict and
+    from_scopus_entry match Paper, so CompactPaper can be used wherever a
+    Paper is read.
+    """
+
+    __slots__ = (
+        "scopus_id",
+        "title",
+        "abstract",
+        "authors",
+        "publication_name",
+        "publication_date",
+        "citation_count",
+        "doi",
+        "keywords",
+        "url",
+    )
+
+    def __init__(
+        self,
+        scopus_id: str,
+        title: str,
+        abstract: str,
+        authors: Iterable[str],
+        publication_name: str,
+        publication_date: str,
+        citation_count: int,
+        doi: Optional[str] = None,
+        keywords: Optional[Iterable[str]] = None,
+        url: Optional[str] = None
+    ):
+        self.scopus_id = scopus_id
+        self.title = title
+        self.abstract = abstract
+        self.authors = _intern_all(authors)
+        self.publication_name = _intern(publication_name)
+        self.publication_date = _intern(publication_date)
+        self.citation_count = citation_count
+        self.doi = doi
+        self.keywords = _intern_all(keywords)
+        self.url = url
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"CompactPaper({fields})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactPaper):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None
+
+    @property
+    def needs_abstract(self) -> bool:
+        """Whether the abstract is missing or looks truncated."""
+        return Paper.needs_abstract.fget(self)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary (same layout as Paper.to_dict)."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["authors"] = list(self.authors)
+        data["keywords"] = list(self.keywords)
+        return data
+
+    @classmethod
+    def from_dict(cls, p: dict) -> "CompactPaper":
+        """Create CompactPaper from a dictionary produced by to_dict."""
+        return cls(
+            scopus_id=p["scopus_id"],
+            title=p["title"],
+            abstract=p["abstract"],
+            authors=p["authors"],
+            publication_name=p["publication_name"],
+            publication_date=p["publication_date"],
+            citation_count=p["citation_count"],
+            doi=p.get("doi"),
+            keywords=p.get("keywords", []),
+            url=p.get("url"),
+        )
+
+    @classmethod
+    def from_paper(cls, paper: Paper) -> "CompactPaper":
+        """Create CompactPaper from a Paper."""
+        return cls.from_dict(paper.to_dict())
+
+    def to_paper(self) -> Paper:
+        """Convert back to a regular Paper."""
+        return Paper.from_dict(self.to_dict())
+
+    @classmethod
+    def from_scopus_entry(cls, entry: dict) -> "CompactPaper":
+        """Create CompactPaper from Scopus API entry."""
+        return cls(**parse_scopus_entry(entry))
@@ -0,0 +1,309 @@
+"""Persistent cross-run deduplication index for papers."""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .paper_fetcher import Paper
+
+# Titles Paper uses when Scopus has none; never a sign of a duplicate
+PLACEHOLDER_TITLES = ("No title",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS paper_keys (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    canonical_id TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS pdf_files (
+    canonical_id TEXT PRIMARY KEY,
+    filepath TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Lower-case a DOI and strip resolver prefixes."""
+    if not doi:
+        return None
+    doi = doi.strip().lower()
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:)", "", doi)
+    return doi or None
+
+
+def title_hash(title: Optional[str]) -> Optional[str]:
+    """Hash a title after removing case, accents, punctuation and spacing."""
+    if not title:
+        return None
+    text = unicodedata.normalize("NFKD", title)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    text = re.sub(r"[\W_]+", "", text)
+    if not text:
+        return None
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def paper_keys(paper: Paper) -> list[tuple[str, str]]:
+    """Get the (kind, key) pairs identifying a paper."""
+    keys = []
+    if paper.scopus_id:
+        keys.append(("scopus_id", paper.scopus_id))
+    doi = normalize_doi(paper.doi)
+    if doi:
+        keys.append(("doi", doi))
+    title = None
+    if paper.title and paper.title.strip() not in PLACEHOLDER_TITLES:
+        title = title_hash(paper.title)
+    if title:
+        keys.append(("title", title))
+    return keys
+
+
+def _match(
+    keys: list[tuple[str, str]],
+    key_map: dict[tuple[str, str], str],
+    dois: dict[str, set[str]]
+) -> Optional[str]:
+    """Get the canonical ID in key_map that keys identify, if any.
+
+    Scopus ID and DOI keys come first and match outright. A title key is
+    only a fallback: it is ignored when the paper has a DOI and the matched
+    entry has other DOIs, since distinct articles (editorials, errata)
+    often share a title.
+    """
+    has_doi = any(kind == "doi" for kind, _ in keys)
+    for key in keys:
+        canonical_id = key_map.get(key)
+        if canonical_id is None:
+            continue
+        if key[0] == "title" and has_doi and dois.get(canonical_id):
+            continue
+        return canonical_id
+    return None
+
+
+def _link(
+    keys: list[tuple[str, str]],
+    canonical_id: str,
+    key_map: dict[tuple[str, str], str],
+    dois: dict[str, set[str]]
+) -> list[tuple[str, str, str]]:
+    """Link the keys not yet in key_map to canonical_id.
+
+    Returns:
+        New (kind, key, canonical_id) rows.
+    """
+    rows = []
+    for key in keys:
+        if key not in key_map:
+            key_map[key] = canonical_id
+            rows.append((key[0], key[1], canonical_id))
+            if key[0] == "doi":
+                dois.setdefault(canonical_id, set()).add(key[1])
+    return rows
+
+
+class DedupIndex:
+    """Maps Scopus IDs, normalized DOIs and title hashes to one canonical ID.
+
+    Two papers are duplicates if they share a Scopus ID or DOI, or if they
+    share a title and do not have conflicting DOIs. All keys are loaded
+    into memory when the index is opened, so membership checks are
+    constant-time and deduplicating n papers is O(n); new keys are written
+    through to SQLite so the index persists across runs. The index also
+    remembers where each canonical paper's PDF was saved, so PDFDownloader
+    can reuse it when the same paper reappears under a different title.
+
+    Example:
+        with DedupIndex("data/papers/dedup_index.db") as index:
+            unique = list(index.dedupe(papers))
+    """
+
+    def __init__(self, db_path: str = "data/papers/dedup_index.db"):
+        """Initialize dedup index.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing).
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+        self._keys: dict[tuple[str, str], str] = {
+            (kind, key): canonical_id
+            for kind, key, canonical_id in self.conn.execute(
+                "SELECT kind, key, canonical_id FROM paper_keys"
+            )
+        }
+        self._dois: dict[str, set[str]] = {}
+        for (kind, key), canonical_id in self._keys.items():
+            if kind == "doi":
+                self._dois.setdefault(canonical_id, set()).add(key)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "DedupIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(set(self._keys.values()))
+
+    def __contains__(self, paper: Paper) -> bool:
+        return self.find(paper) is not None
+
+    def find(self, paper: Paper) -> Optional[str]:
+        """Get the canonical ID of a paper already in the index.
+
+        Args:
+            paper: Paper to look up.
+
+        Returns:
+            Canonical ID, or None if no key matches.
+        """
+        return _match(paper_keys(paper), self._keys, self._dois)
+
+    def add(self, paper: Paper) -> tuple[str, bool]:
+        """Register a paper, linking any new keys to its canonical ID.
+
+        Args:
+            paper: Paper to register.
+
+        Returns:
+            Tuple of (canonical ID, whether the paper was already known).
+        """
+        return self.add_many([paper])[0]
+
+    def add_many(self, papers: Iterable[Paper]) -> list[tuple[str, bool]]:
+        """Register several papers in one transaction (see add)."""
+        results = []
+        new_rows = []
+
+        with self._lock:
+            for paper in papers:
+                keys = paper_keys(paper)
+                canonical_id = _match(keys, self._keys, self._dois)
+                known = canonical_id is not None
+                if canonical_id is None:
+                    canonical_id = paper.scopus_id or (keys[0][1] if keys else "")
+
+                new_rows.extend(_link(keys, canonical_id, self._keys, self._dois))
+                results.append((canonical_id, known))
+
+            self._write_keys(new_rows)
+
+        return results
+
+    def _write_keys(self, rows: list[tuple[str, str, str]]) -> None:
+        """Persist new key rows (caller holds the lock)."""
+        if rows:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO paper_keys (kind, key, canonical_id) "
+                    "VALUES (?, ?, ?)",
+                    rows
+                )
+
+    def dedupe(self, papers: Iterable[Paper], register: bool = True) -> Iterator[Paper]:
+        """Yield only papers not seen before (in the index or earlier in papers).
+
+        Args:
+            papers: Papers to filter, e.g. concatenated saved files.
+            register: Whether to add the yielded papers to the index.
+
+        Yields:
+            First occurrence of each distinct paper.
+        """
+        batch_keys: dict[tuple[str, str], str] = {}
+        batch_dois: dict[str, set[str]] = {}
+        pending = []
+        for paper in papers:
+            keys = paper_keys(paper)
+            canonical_id = paper.scopus_id or (keys[0][1] if keys else "")
+            if register:
+                with self._lock:
+                    if _match(keys, self._keys, self._dois) is not None:
+                        continue
+                    pending.extend(_link(keys, canonical_id, self._keys, self._dois))
+                    if len(pending) >= 1000:
+                        self._write_keys(pending)
+                        pending = []
+            else:
+                if (_match(keys, self._keys, self._dois) is not None
+                        or _match(keys, batch_keys, batch_dois) is not None):
+                    continue
+                _link(keys, canonical_id, batch_keys, batch_dois)
+            yield paper
+
+        if pending:
+            with self._lock:
+                self._write_keys(pending)
+
+    def register(self, papers: Iterable[Paper]) -> Iterator[Paper]:
+        """Yield every paper, adding them to the index in batches.
+
+        Args:
+            papers: Papers to register.
+
+        Yields:
+            The same papers, unchanged.
+        """
+        pending = []
+        for paper in papers:
+            pending.append(paper)
+            if len(pending) >= 1000:
+                self.add_many(pending)
+                pending = []
+            yield paper
+
+        if pending:
+            self.add_many(pending)
+
+    def get_pdf_path(self, paper: Paper) -> Optional[Path]:
+        """Get the saved PDF of a paper or any of its duplicates.
+
+        Args:
+            paper: Paper to look up.
+
+        Returns:
+            Path to an existing PDF file, or None.
+        """
+        canonical_id = self.find(paper)
+        if canonical_id is None:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT filepath FROM pdf_files WHERE canonical_id = ?",
+                (canonical_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        filepath = Path(row[0])
+        return filepath if filepath.exists() else None
+
+    def set_pdf_path(self, paper: Paper, filepath: Path) -> None:
+        """Record where a paper's PDF was saved.
+
+        Args:
+            paper: Downloaded paper.
+            filepath: Path of the saved PDF.
+        """
+        canonical_id, _ = self.add(paper)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO pdf_files (canonical_id, filepath) VALUES (?, ?) "
+                "ON CONFLICT (canonical_id) DO UPDATE SET filepath = excluded.filepath",
+                (canonical_id, str(filepath))
+            )
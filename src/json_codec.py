@@ -0,0 +1,62 @@
+"""JSON serialization with an optional fast backend.
+
+Uses ``orjson`` when it is installed and falls back to the standard library
+otherwise. Both backends write UTF-8 without ASCII escaping and, with
+``indent=True``, the same two-space layout as ``json.dump(..., indent=2)``,
+so files written by either backend can be read by the other.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        Encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_file(obj: Any, filepath: Union[str, Path], indent: bool = False) -> None:
+    """Write an object to a JSON file.
+
+    Args:
+        obj: Object to serialize.
+        filepath: Output file path.
+        indent: Pretty-print with two-space indentation.
+    """
+    with open(filepath, "wb") as f:
+        f.write(dumps(obj, indent=indent))
+
+
+def load_file(filepath: Union[str, Path]) -> Any:
+    """Read a JSON file."""
+    with open(filepath, "rb") as f:
+        return loads(f.read())
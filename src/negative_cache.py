@@ -0,0 +1,171 @@
+"""Persistent cache of failed PDF download attempts."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .dedup_index import normalize_doi
+
+# Seconds a failure stays cached, by failure class
+DEFAULT_TTLS = {
+    "forbidden": 30 * 86400,  # 403: no subscription or IP not authorized
+    "not_found": 30 * 86400,  # 404/410: source does not have the article
+    "unavailable": 7 * 86400,  # no PDF / no open access copy (yet)
+    "timeout": 3600,
+    "error": 3600,  # 401 (API key problem), 429, 5xx, connection errors
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS failures (
+    doi TEXT NOT NULL,
+    source TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    failed_at REAL NOT NULL,
+    PRIMARY KEY (doi, source)
+) WITHOUT ROWID;
+"""
+
+
+def failure_class(status_code: int) -> str:
+    """Classify an HTTP status of a failed attempt (see DEFAULT_TTLS)."""
+    if status_code == 403:
+        return "forbidden"
+    if status_code in (404, 410):
+        return "not_found"
+    if status_code in (401, 429) or status_code >= 500:
+        return "error"
+    return "unavailable"
+
+
+class NegativeCache:
+    """Remembers (DOI, source) pairs that recently failed to return a PDF.
+
+    Each failure is stored with its class and timestamp and expires after
+    the TTL of its class, so paywalled (403) and missing (404) articles are
+    skipped for weeks while timeouts and server errors are retried soon.
+    A later success for the pair removes the entry.
+
+    Example:
+        with NegativeCache("data/pdfs/negative_cache.db") as cache:
+            downloader = PDFDownloader(negative_cache=cache)
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/pdfs/negative_cache.db",
+        ttls: Optional[dict[str, float]] = None,
+        refresh: bool = False
+    ):
+        """Initialize negative cache.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing).
+            ttls: Per failure class overrides, merged into DEFAULT_TTLS.
+            refresh: Ignore cached failures (retry everything) but keep
+                recording new outcomes.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.refresh = refresh
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+        self._failures: dict[tuple[str, str], tuple[str, float]] = {
+            (doi, source): (outcome, failed_at)
+            for doi, source, outcome, failed_at in self.conn.execute(
+                "SELECT doi, source, outcome, failed_at FROM failures"
+            )
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "NegativeCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._failures)
+
+    def get(self, doi: str, source: str) -> Optional[tuple[str, float]]:
+        """Get the unexpired failure recorded for a DOI and source.
+
+        Args:
+            doi: Paper DOI.
+            source: Source name (e.g. "elsevier").
+
+        Returns:
+            Tuple of (failure class, failure timestamp), or None.
+        """
+        entry = self._failures.get((normalize_doi(doi), source))
+        if entry is None:
+            return None
+        outcome, failed_at = entry
+        if time.time() - failed_at > self.ttls.get(outcome, 0):
+            return None
+        return entry
+
+    def is_dead(self, doi: str, source: str) -> bool:
+        """Whether a source should be skipped for a DOI."""
+        return not self.refresh and self.get(doi, source) is not None
+
+    def record_failure(self, doi: str, source: str, outcome: str) -> None:
+        """Record a failed attempt.
+
+        Args:
+            doi: Paper DOI.
+            source: Source name.
+            outcome: Failure class (a key of DEFAULT_TTLS).
+        """
+        doi = normalize_doi(doi)
+        if not doi:
+            return
+        failed_at = time.time()
+        with self._lock:
+            self._failures[(doi, source)] = (outcome, failed_at)
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO failures (doi, source, outcome, failed_at) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (doi, source) DO UPDATE SET "
+                    "outcome = excluded.outcome, failed_at = excluded.failed_at",
+                    (doi, source, outcome, failed_at)
+                )
+
+    def record_success(self, doi: str, source: str) -> None:
+        """Forget any failure recorded for a DOI and source."""
+        key = (normalize_doi(doi), source)
+        with self._lock:
+            if self._failures.pop(key, None) is not None:
+                with self.conn:
+                    self.conn.execute(
+                        "DELETE FROM failures WHERE doi = ? AND source = ?", key
+                    )
+
+    def purge(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of entries deleted.
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                key for key, (outcome, failed_at) in self._failures.items()
+                if now - failed_at > self.ttls.get(outcome, 0)
+            ]
+            for key in expired:
+                del self._failures[key]
+            with self.conn:
+                self.conn.executemany(
+                    "DELETE FROM failures WHERE doi = ? AND source = ?", expired
+                )
+        return len(expired)
@@ -0,0 +1,165 @@
+"""Lazy, memory-mapped access to saved paper files.
+
+``PaperCorpus`` opens a ``.json`` or ``.jsonl`` papers file written by
+PaperFetcher using the offset index saved next to it (``<name>.idx``), which
+holds the byte span of every paper record. The file itself is
+memory-mapped, so indexing a paper or slicing a range decodes only those
+records; selecting a few papers from a 100k-record file does not parse the
+rest.
+
+Files without a valid index (written by an older version, or edited since)
+still open: a JSONL file is indexed by scanning its lines (and the index is
+saved for next time), while a JSON file is parsed in full and its records
+are kept in memory.
+"""
+
+import mmap
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from . import json_codec
+from .paper_fetcher import Paper
+from .paper_io import index_path, read_index, write_index
+
+
+def _scan_jsonl(mm: mmap.mmap) -> tuple[dict, list[tuple[int, int]]]:
+    """Get the header and record spans of a JSONL papers file."""
+    header_end = mm.find(b"\n")
+    if header_end < 0:
+        header_end = len(mm)
+    header = json_codec.loads(mm[:header_end]) if mm[:header_end].strip() else {}
+
+    spans = []
+    pos = header_end + 1
+    size = len(mm)
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end < 0:
+            # Keep an unterminated last line only if it is a complete record
+            end = size
+            try:
+                json_codec.loads(mm[pos:end])
+            except ValueError:
+                break
+        if mm[pos:end].strip():
+            spans.append((pos, end))
+        pos = end + 1
+
+    metadata = {
+        "query": header.get("query"),
+        "fetched_at": header.get("fetched_at"),
+    }
+    return metadata, spans
+
+
+class PaperCorpus(Sequence):
+    """Read-only sequence of the papers in a saved ``.json``/``.jsonl`` file.
+
+    Papers are decoded on access and not kept in memory (unless a JSON file
+    without an index had to be parsed in full), so ``corpus[i]`` returns a
+    new object each time.
+
+    Example:
+        with PaperCorpus("data/papers/papers_20241201_120000.json") as corpus:
+            print(len(corpus))
+            selected = corpus[0:5]
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        paper_class: type = Paper,
+        use_index_file: bool = True
+    ):
+        """Open a papers file.
+
+        Args:
+            filepath: Path to a ``.json`` or ``.jsonl`` papers file.
+            paper_class: Paper or CompactPaper.
+            use_index_file: Whether to use the ``.idx`` offset index.
+
+        Raises:
+            ValueError: If the file is empty or not a papers file.
+        """
+        self.filepath = Path(filepath)
+        self.paper_class = paper_class
+        self.index_path = index_path(self.filepath)
+
+        self._file = open(self.filepath, "rb")
+        if self.filepath.stat().st_size == 0:
+            self._file.close()
+            raise ValueError(f"Empty papers file: {self.filepath}")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._records: Optional[list[dict]] = None
+
+        loaded = read_index(self.filepath) if use_index_file else None
+        if loaded is not None:
+            metadata, self._offsets = loaded
+        elif self.filepath.suffix == ".jsonl":
+            metadata, spans = _scan_jsonl(self._mm)
+            self._offsets = array("q", [pos for span in spans for pos in span])
+            if use_index_file:
+                write_index(self.filepath, metadata, self._offsets)
+        else:
+            metadata = self._load_json()
+
+        self.metadata = {**metadata, "count": len(self)}
+
+    def _load_json(self) -> dict:
+        """Parse a JSON papers file in full (used when it has no index)."""
+        data = json_codec.loads(self._mm[:])
+        if not isinstance(data, dict) or not isinstance(data.get("papers"), list):
+            raise ValueError(f"Not a papers file: {self.filepath}")
+        self._records = data["papers"]
+        self._offsets = array("q")
+        return {
+            "query": data.get("query"),
+            "fetched_at": data.get("fetched_at"),
+        }
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "PaperCorpus":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        if self._records is not None:
+            return len(self._records)
+        return len(self._offsets) // 2
+
+    def record(self, index: int) -> dict:
+        """Decode one paper record without creating a Paper.
+
+        Args:
+            index: Record index (negative indices count from the end).
+
+        Returns:
+            Paper dict as saved.
+        """
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("paper index out of range")
+        if self._records is not None:
+            return self._records[index]
+        start = self._offsets[2 * index]
+        end = self._offsets[2 * index + 1]
+        return json_codec.loads(self._mm[start:end])
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Paper, list[Paper]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.paper_class.from_dict(self.record(index))
+
+    def __iter__(self) -> Iterator[Paper]:
+        for i in range(len(self)):
+            yield self[i]
@@ -1,14 +1,82 @@
 """Paper fetcher and data storage for Scopus search results."""
 
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
-
+from typing import TYPE_CHECKING, ClassVar, Iterator, Optional
+
+import requests
+
+from . import json_codec
+from .paper_io import (
+    JsonlPaperWriter,
+    index_path,
+    iter_jsonl_records,
+    read_jsonl_header,
+    write_json_papers,
+)
+from .query_builder import QueryBuilder, build_query_from_topic, year_range_clause
+from .query_history import QueryHistory
+from .query_planner import YearShardPlanner
+from .response_cache import ResponseCache
 from .scopus_client import ScopusClient
-from .query_builder import QueryBuilder, build_query_from_topic
+
+if TYPE_CHECKING:
+    from .dedup_index import DedupIndex
+    from .paper_store import PaperStore
+
+NO_ABSTRACT = "No abstract available"
+
+
+def parse_year(publication_date: Optional[str]) -> Optional[int]:
+    """Get the year of a ``YYYY-MM-DD`` publication date, or None."""
+    try:
+        return int((publication_date or "")[:4])
+    except ValueError:
+        return None
+
+
+def parse_scopus_entry(entry: dict) -> dict:
+    """Extract the Paper fields from a Scopus API search entry.
+
+    Args:
+        entry: One item of ``search-results.entry``.
+
+    Returns:
+        Keyword arguments for Paper or CompactPaper.
+    """
+    # Extract authors
+    authors = []
+    if "author" in entry:
+        for author in entry.get("author", []):
+            name = author.get("authname", "")
+            if name:
+                authors.append(name)
+
+    # Extract keywords
+    keywords = []
+    if "authkeywords" in entry:
+        kw_str = entry.get("authkeywords", "")
+        if kw_str:
+            keywords = [k.strip() for k in kw_str.split("|")]
+
+    # Get Scopus ID
+    scopus_id = entry.get("dc:identifier", "").replace("SCOPUS_ID:", "")
+
+    return {
+        "scopus_id": scopus_id,
+        "title": entry.get("dc:title", "No title"),
+        "abstract": entry.get("dc:description", NO_ABSTRACT),
+        "authors": authors,
+        "publication_name": entry.get("prism:publicationName", "Unknown"),
+        "publication_date": entry.get("prism:coverDate", "Unknown"),
+        "citation_count": int(entry.get("citedby-count", 0)),
+        "doi": entry.get("prism:doi"),
+        "keywords": keywords,
+        "url": entry.get("prism:url"),
+    }
 
 
 @dataclass
@@ -26,48 +94,87 @@ class Paper:
     keywords: list[str] = None
     url: Optional[str] = None
 
+    # Scopus search fields read by from_scopus_entry, per attribute
+    SCOPUS_FIELDS: ClassVar[dict[str, str]] = {
+        "scopus_id": "dc:identifier",
+        "title": "dc:title",
+        "abstract": "dc:description",
+        "authors": "author",
+        "publication_name": "prism:publicationName",
+        "publication_date": "prism:coverDate",
+        "citation_count": "citedby-count",
+        "doi": "prism:doi",
+        "keywords": "authkeywords",
+        "url": "prism:url",
+    }
+    # Attributes whose fields only exist in the COMPLETE view
+    COMPLETE_VIEW_ATTRIBUTES: ClassVar[frozenset[str]] = frozenset(
+        {"abstract", "authors", "keywords"}
+    )
+
+    @classmethod
+    def scopus_projection(cls, attributes: list[str]) -> tuple[str, str]:
+        """Get the Scopus view and field list needed for some attributes.
+
+        scopus_id is always included.
+
+        Args:
+            attributes: Paper attribute names to populate.
+
+        Returns:
+            Tuple of (view, comma-separated field string).
+
+        Raises:
+            ValueError: If an attribute name is unknown.
+        """
+        unknown = set(attributes) - cls.SCOPUS_FIELDS.keys()
+        if unknown:
+            raise ValueError(f"Unknown Paper attributes: {', '.join(sorted(unknown))}")
+
+        wanted = ["scopus_id"] + [a for a in attributes if a != "scopus_id"]
+        view = "COMPLETE" if cls.COMPLETE_VIEW_ATTRIBUTES & set(wanted) else "STANDARD"
+        fields = ",".join(cls.SCOPUS_FIELDS[a] for a in wanted)
+        return view, fields
+
     def __post_init__(self):
         if self.keywords is None:
             self.keywords = []
 
+    @property
+    def needs_abstract(self) -> bool:
+        """Whether the abstract is missing or looks truncated."""
+        abstract = (self.abstract or "").strip()
+        return (
+            not abstract
+            or abstract == NO_ABSTRACT
+            or abstract.endswith(("...", "\u2026"))
+        )
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return asdict(self)
 
     @classmethod
-    def from_scopus_entry(cls, entry: dict) -> "Paper":
-        """Create Paper from Scopus API entry."""
-        # Extract authors
-        authors = []
-        if "author" in entry:
-            for author in entry.get("author", []):
-                name = author.get("authname", "")
-                if name:
-                    authors.append(name)
-
-        # Extract keywords
-        keywords = []
-        if "authkeywords" in entry:
-            kw_str = entry.get("authkeywords", "")
-            if kw_str:
-                keywords = [k.strip() for k in kw_str.split("|")]
-
-        # Get Scopus ID
-        scopus_id = entry.get("dc:identifier", "").replace("SCOPUS_ID:", "")
-
+    def from_dict(cls, p: dict) -> "Paper":
+        """Create Paper from a dictionary produced by to_dict."""
         return cls(
-            scopus_id=scopus_id,
-            title=entry.get("dc:title", "No title"),
-            abstract=entry.get("dc:description", "No abstract available"),
-            authors=authors,
-            publication_name=entry.get("prism:publicationName", "Unknown"),
-            publication_date=entry.get("prism:coverDate", "Unknown"),
-            citation_count=int(entry.get("citedby-count", 0)),
-            doi=entry.get("prism:doi"),
-            keywords=keywords,
-            url=entry.get("prism:url"),
+            scopus_id=p["scopus_id"],
+            title=p["title"],
+            abstract=p["abstract"],
+            authors=p["authors"],
+            publication_name=p["publication_name"],
+            publication_date=p["publication_date"],
+            citation_count=p["citation_count"],
+            doi=p.get("doi"),
+            keywords=p.get("keywords", []),
+            url=p.get("url"),
         )
 
+    @classmethod
+    def from_scopus_entry(cls, entry: dict) -> "Paper":
+        """Create Paper from Scopus API entry."""
+        return cls(**parse_scopus_entry(entry))
+
 
 class PaperFetcher:
     """Fetches and stores papers from Scopus."""
@@ -75,17 +182,85 @@ class PaperFetcher:
     def __init__(
         self,
         data_dir: str = "data/papers",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        max_workers: int = 1,
+        cache: Optional[ResponseCache] = None,
+        paper_fields: Optional[list[str]] = None,
+        enrich: bool = False,
+        store: Optional["PaperStore"] = None,
+        output_format: str = "json",
+        history: Optional[QueryHistory] = None,
+        dedup_index: Optional["DedupIndex"] = None,
+        skip_duplicates: bool = False,
+        compact: bool = False,
+        json_indent: bool = True
     ):
         """Initialize paper fetcher.
 
         Args:
             data_dir: Directory to store paper data.
             api_key: Scopus API key (optional, uses env var if not provided).
+            max_workers: Number of concurrent Scopus page requests.
+            cache: Optional on-disk cache for Scopus search pages.
+            paper_fields: Paper attributes to request from Scopus. Restricting
+                them shrinks responses; other attributes get their defaults.
+                None requests the full COMPLETE view.
+            enrich: Fill in missing or truncated abstracts via the Abstract
+                Retrieval API after each fetch (see enrich_abstracts).
+            store: Optional SQLite paper store. When given, fetched papers are
+                saved there instead of timestamped JSON files.
+            output_format: "json" writes one document after fetching;
+                "jsonl" appends and flushes each paper as it is fetched.
+            history: Per-query run history used by fetch_new_papers. Defaults
+                to ``<data_dir>/query_history.db`` on first use.
+            dedup_index: Optional cross-run dedup index. Every fetched paper
+                is registered in it.
+            skip_duplicates: Drop papers already in dedup_index (from earlier
+                runs or other queries) from fetch results.
+            compact: Build slotted CompactPaper objects with interned strings
+                instead of Paper, for large corpora.
+            json_indent: Pretty-print saved JSON files. False writes compact
+                JSON, which is smaller and faster to write and read.
         """
+        if output_format not in ("json", "jsonl"):
+            raise ValueError(f"Unsupported output format: {output_format}")
+
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.client = ScopusClient(api_key=api_key)
+        view, fields = "COMPLETE", None
+        if paper_fields:
+            view, fields = Paper.scopus_projection(paper_fields)
+        self.client = ScopusClient(
+            api_key=api_key,
+            max_workers=max_workers,
+            cache=cache,
+            view=view,
+            fields=fields
+        )
+        self.enrich = enrich
+        self.store = store
+        self.output_format = output_format
+        self._history = history
+        self.dedup_index = dedup_index
+        self.skip_duplicates = skip_duplicates
+        self.json_indent = json_indent
+
+        if compact:
+            from .compact_paper import CompactPaper
+            self.paper_class = CompactPaper
+        else:
+            self.paper_class = Paper
+        self._abstracts: dict[str, Optional[str]] = {}
+
+    def close(self) -> None:
+        """Close the underlying Scopus client session."""
+        self.client.close()
+
+    def __enter__(self) -> "PaperFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def fetch_papers(
         self,
@@ -103,14 +278,230 @@ class PaperFetcher:
         Returns:
             List of Paper objects.
         """
-        entries = self.client.search_all(query, total_count=count)
-        papers = [Paper.from_scopus_entry(entry) for entry in entries]
+        papers_iter = self.iter_papers(query, count=count)
+        if save and self._streams_saves:
+            return list(self._stream_save(papers_iter, query))
+
+        papers = list(papers_iter)
+        if self.enrich:
+            self.enrich_abstracts(papers)
 
         if save and papers:
             self._save_papers(papers, query)
 
         return papers
 
+    def iter_papers(self, query: str, count: int = 50) -> Iterator[Paper]:
+        """Stream papers matching query as their result pages arrive.
+
+        Args:
+            query: Scopus search query.
+            count: Number of papers to fetch.
+
+        Yields:
+            Paper objects in result order.
+        """
+        papers = (
+            self.paper_class.from_scopus_entry(entry)
+            for entry in self.client.iter_search(query, total_count=count)
+        )
+        yield from self._apply_dedup(papers)
+
+    def _apply_dedup(self, papers: Iterator[Paper]) -> Iterator[Paper]:
+        """Register papers in the dedup index, dropping known ones if enabled."""
+        if self.dedup_index is None:
+            yield from papers
+        elif self.skip_duplicates:
+            yield from self.dedup_index.dedupe(papers)
+        else:
+            yield from self.dedup_index.register(papers)
+
+    @property
+    def history(self) -> QueryHistory:
+        """Per-query run history (opened on first use)."""
+        if self._history is None:
+            self._history = QueryHistory(str(self.data_dir / "query_history.db"))
+        return self._history
+
+    def fetch_new_papers(
+        self,
+        query: str,
+        count: int = 50,
+        save: bool = True
+    ) -> list[Paper]:
+        """Fetch only papers not seen in earlier runs of the same query.
+
+        On the first run this behaves like fetch_papers and records the
+        results. Later runs restrict the query to records first loaded since
+        the last run (``ORIG-LOAD-DATE AFT``, with a one-day margin), sort by
+        that date, newest first, skip known Scopus IDs, and stop paginating
+        after a full page of known IDs, so a nightly job needs only a few
+        requests. Filtering on the original load date (not ``LOAD-DATE``,
+        which changes whenever Scopus updates a record) keeps old papers
+        out of the window. Papers loaded during the one-day overlap were seen
+        by the last run and sort after the new ones, so the stop never skips
+        new papers.
+
+        If ``count`` stops the run before the known IDs are reached, the
+        last run time is not advanced, so the next run's window still covers
+        the new papers that were not fetched (known IDs are skipped).
+
+        Args:
+            query: Scopus search query.
+            count: Maximum number of new papers to fetch.
+            save: Whether to save the new papers to file.
+
+        Returns:
+            List of new Paper objects.
+        """
+        started_at = datetime.now()
+        last_run = self.history.last_run(query)
+        capped = False
+
+        if last_run is None:
+            papers = self.fetch_papers(query, count=count, save=save)
+        else:
+            seen = self.history.seen_ids(query)
+            since = (last_run - timedelta(days=1)).strftime("%Y%m%d")
+            delta_query = f"({query}) AND ORIG-LOAD-DATE AFT {since}"
+
+            papers = []
+            known_streak = 0
+            entries = self.client.iter_search(
+                delta_query,
+                total_count=self.client.MAX_START_OFFSET,
+                max_workers=1,
+                sort="-orig-load-date"
+            )
+            for entry in entries:
+                paper = self.paper_class.from_scopus_entry(entry)
+                if paper.scopus_id in seen:
+                    known_streak += 1
+                    if known_streak >= self.client.PAGE_SIZE:
+                        break
+                    continue
+                known_streak = 0
+                seen.add(paper.scopus_id)
+                papers.append(paper)
+                if len(papers) >= count:
+                    capped = True
+                    break
+            entries.close()
+            papers = list(self._apply_dedup(iter(papers)))
+
+            if self.enrich:
+                self.enrich_abstracts(papers)
+            if save and papers:
+                self._save_papers(papers, query)
+
+        self.history.record_run(
+            query,
+            (p.scopus_id for p in papers),
+            started_at,
+            advance_last_run=not capped
+        )
+        return papers
+
+    def fetch_exhaustive(
+        self,
+        query: str,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        save: bool = True
+    ) -> list[Paper]:
+        """Fetch every paper matching query by splitting it into year shards.
+
+        Args:
+            query: Scopus search query without a PUBYEAR filter.
+            year_from: Start year (defaults to the planner's min_year).
+            year_to: End year (defaults to the current year).
+            save: Whether to save results to file.
+
+        Returns:
+            List of Paper objects, ordered by year shard.
+        """
+        planner = YearShardPlanner(self.client, max_workers=self.client.max_workers)
+        shards = planner.plan(query, year_from, year_to)
+        papers_iter = self._apply_dedup(
+            self.paper_class.from_scopus_entry(entry)
+            for entry in planner.iter_entries(shards)
+        )
+        saved_query = query + year_range_clause(year_from, year_to)
+        if save and self._streams_saves:
+            return list(self._stream_save(papers_iter, saved_query))
+
+        papers = list(papers_iter)
+        if self.enrich:
+            self.enrich_abstracts(papers)
+
+        if save and papers:
+            self._save_papers(papers, saved_query)
+
+        return papers
+
+    def enrich_abstracts(
+        self,
+        papers: list[Paper],
+        max_workers: Optional[int] = None
+    ) -> int:
+        """Fill in missing or truncated abstracts from the Abstract Retrieval API.
+
+        Papers that already have an abstract are skipped. Lookups run
+        concurrently through the client's rate limiter, and results are
+        cached per Scopus ID (in memory, and on disk when the client has a
+        response cache), so repeated enrichment does not hit the API again.
+
+        Args:
+            papers: Papers to enrich in place.
+            max_workers: Number of concurrent lookups
+                (defaults to max(4, client max_workers)).
+
+        Returns:
+            Number of papers whose abstract was filled in.
+        """
+        targets = [p for p in papers if p.scopus_id and p.needs_abstract]
+        scopus_ids = list(dict.fromkeys(p.scopus_id for p in targets))
+        if not scopus_ids:
+            return 0
+
+        workers = max_workers or max(4, self.client.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            abstracts = dict(zip(
+                scopus_ids, executor.map(self._get_abstract_text, scopus_ids)
+            ))
+
+        enriched = 0
+        for paper in targets:
+            abstract = abstracts.get(paper.scopus_id)
+            if abstract:
+                paper.abstract = abstract
+                enriched += 1
+        return enriched
+
+    def _get_abstract_text(self, scopus_id: str) -> Optional[str]:
+        """Look up the abstract text for a Scopus ID, using the caches."""
+        if scopus_id in self._abstracts:
+            return self._abstracts[scopus_id]
+
+        cache = self.client.cache
+        cache_key = {"abstract_scopus_id": scopus_id}
+        cached = cache.get(cache_key) if cache is not None else None
+        if cached is not None:
+            abstract = cached.get("abstract")
+        else:
+            try:
+                data = self.client.get_abstract(scopus_id)
+            except requests.exceptions.RequestException:
+                # Leave the paper as is; a later run may succeed
+                return None
+            coredata = data.get("abstracts-retrieval-response", {}).get("coredata", {})
+            abstract = coredata.get("dc:description") or None
+            if cache is not None:
+                cache.put(cache_key, {"abstract": abstract})
+
+        self._abstracts[scopus_id] = abstract
+        return abstract
+
     def fetch_by_topic(
         self,
         topic: str,
@@ -120,7 +511,9 @@ class PaperFetcher:
         exclude: Optional[list[str]] = None,
         year_from: Optional[int] = None,
         year_to: Optional[int] = None,
-        save: bool = True
+        save: bool = True,
+        exhaustive: bool = False,
+        new_only: bool = False
     ) -> tuple[str, list[Paper]]:
         """Fetch papers by topic with automatic query building.
 
@@ -133,10 +526,23 @@ class PaperFetcher:
             year_from: Start year filter.
             year_to: End year filter.
             save: Whether to save results.
+            exhaustive: Ignore count and fetch every match via year shards.
+            new_only: Only fetch papers not seen in earlier runs
+                (see fetch_new_papers).
 
         Returns:
             Tuple of (query_string, list of Papers).
         """
+        if exhaustive:
+            query = build_query_from_topic(
+                topic=topic,
+                additional_terms=additional_terms,
+                additional_terms_or=additional_terms_or,
+                exclude=exclude
+            )
+            papers = self.fetch_exhaustive(query, year_from, year_to, save=save)
+            return query + year_range_clause(year_from, year_to), papers
+
         query = build_query_from_topic(
             topic=topic,
             additional_terms=additional_terms,
@@ -146,61 +552,126 @@ class PaperFetcher:
             year_to=year_to
         )
 
-        papers = self.fetch_papers(query, count=count, save=save)
+        if new_only:
+            papers = self.fetch_new_papers(query, count=count, save=save)
+        else:
+            papers = self.fetch_papers(query, count=count, save=save)
         return query, papers
 
+    @property
+    def _streams_saves(self) -> bool:
+        return self.output_format == "jsonl" and self.store is None
+
+    def _new_papers_path(self, suffix: str) -> Path:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return self.data_dir / f"papers_{timestamp}{suffix}"
+
+    def _stream_save(self, papers: Iterator[Paper], query: str) -> Iterator[Paper]:
+        """Append papers to a new JSONL file as they arrive.
+
+        Each page's worth of papers is enriched (if enabled) and flushed to
+        disk before being passed on, so an interrupted harvest keeps every
+        paper written so far. An empty result leaves no file behind.
+
+        Args:
+            papers: Papers to save.
+            query: Query used to fetch papers.
+
+        Yields:
+            The saved papers, in order.
+        """
+        filepath = self._new_papers_path(".jsonl")
+        with JsonlPaperWriter(filepath, query) as writer:
+            batch = []
+            for paper in papers:
+                batch.append(paper)
+                if len(batch) >= self.client.PAGE_SIZE:
+                    yield from self._write_batch(writer, batch)
+                    batch = []
+            yield from self._write_batch(writer, batch)
+
+        if writer.count == 0:
+            filepath.unlink(missing_ok=True)
+            index_path(filepath).unlink(missing_ok=True)
+
+    def _write_batch(
+        self, writer: JsonlPaperWriter, batch: list[Paper]
+    ) -> Iterator[Paper]:
+        if self.enrich:
+            self.enrich_abstracts(batch)
+        for paper in batch:
+            writer.write(paper.to_dict())
+            yield paper
+
     def _save_papers(self, papers: list[Paper], query: str) -> Path:
-        """Save papers to JSON file.
+        """Save papers to JSON file, or to the paper store if one is set.
 
         Args:
             papers: List of papers to save.
             query: Query used to fetch papers.
 
         Returns:
-            Path to saved file.
+            Path to saved file (the database path when using the store).
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"papers_{timestamp}.json"
-        filepath = self.data_dir / filename
+        if self.store is not None:
+            self.store.add_papers(papers, query)
+            return self.store.db_path
 
-        data = {
+        if self.output_format == "jsonl":
+            with JsonlPaperWriter(self._new_papers_path(".jsonl"), query) as writer:
+                for paper in papers:
+                    writer.write(paper.to_dict())
+            return writer.filepath
+
+        filepath = self._new_papers_path(".json")
+
+        metadata = {
             "query": query,
             "fetched_at": datetime.now().isoformat(),
             "count": len(papers),
-            "papers": [p.to_dict() for p in papers]
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json_papers(
+            filepath,
+            metadata,
+            (p.to_dict() for p in papers),
+            indent=self.json_indent
+        )
 
         return filepath
 
     def load_papers(self, filepath: str) -> tuple[dict, list[Paper]]:
         """Load papers from JSON file.
 
+        JSONL files (``.jsonl``) are read one record at a time. A SQLite
+        paper store (``.db``/``.sqlite``) loads its latest query run, and
+        Parquet/Arrow files are read with pyarrow.
+
         Args:
-            filepath: Path to JSON file.
+            filepath: Path to JSON file or paper store database.
 
         Returns:
             Tuple of (metadata dict, list of Papers).
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        papers = []
-        for p in data.get("papers", []):
-            papers.append(Paper(
-                scopus_id=p["scopus_id"],
-                title=p["title"],
-                abstract=p["abstract"],
-                authors=p["authors"],
-                publication_name=p["publication_name"],
-                publication_date=p["publication_date"],
-                citation_count=p["citation_count"],
-                doi=p.get("doi"),
-                keywords=p.get("keywords", []),
-                url=p.get("url"),
-            ))
+        from . import columnar
+        from .paper_store import SQLITE_SUFFIXES, PaperStore
+
+        if Path(filepath).suffix in SQLITE_SUFFIXES:
+            with PaperStore(filepath) as store:
+                return store.load_run()
+
+        if Path(filepath).suffix in columnar.COLUMNAR_SUFFIXES:
+            return columnar.load_papers(filepath)
+
+        if Path(filepath).suffix == ".jsonl":
+            metadata = read_jsonl_header(filepath)
+            papers = list(iter_saved_papers(filepath, self.paper_class))
+            metadata["count"] = len(papers)
+            return metadata, papers
+
+        data = json_codec.load_file(filepath)
+
+        papers = [self.paper_class.from_dict(p) for p in data.get("papers", [])]
 
         metadata = {
             "query": data.get("query"),
@@ -216,12 +687,29 @@ class PaperFetcher:
         Returns:
             Path to latest file, or None if no files exist.
         """
-        files = list(self.data_dir.glob("papers_*.json"))
+        files = [
+            *self.data_dir.glob("papers_*.json"),
+            *self.data_dir.glob("papers_*.jsonl"),
+        ]
         if not files:
             return None
         return max(files, key=lambda f: f.stat().st_mtime)
 
 
+def iter_saved_papers(filepath: str, paper_class: type = Paper) -> Iterator[Paper]:
+    """Stream papers from a saved JSONL papers file with constant memory.
+
+    Args:
+        filepath: Path to a ``.jsonl`` file written by PaperFetcher.
+        paper_class: Paper or CompactPaper.
+
+    Yields:
+        Paper objects in file order.
+    """
+    for record in iter_jsonl_records(filepath):
+        yield paper_class.from_dict(record)
+
+
 def generate_review_summary(papers: list[Paper], query: str) -> str:
     """Generate a summary for AI agent review.
 
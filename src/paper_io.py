@@ -0,0 +1,235 @@
+"""Append-only JSONL format for saved paper files.
+
+The first line of a ``.jsonl`` papers file is a header record with the query
+metadata; every following line is one paper dict (as produced by
+``Paper.to_dict``). Papers are appended and flushed as they are fetched, so
+an interrupted harvest keeps everything written so far, and files can be
+read back one record at a time.
+
+Writers also save an offset index next to the file (``<name>.idx``) with
+the byte span of every paper record, so PaperCorpus can open the file
+without scanning it.
+"""
+
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from . import json_codec
+
+JSONL_FORMAT = "papersearch-jsonl/1"
+INDEX_FORMAT = "papersearch-index/1"
+INDEX_SUFFIX = ".idx"
+
+
+def index_path(filepath: Union[str, Path]) -> Path:
+    """Get the offset index path of a papers file."""
+    filepath = Path(filepath)
+    return filepath.with_name(filepath.name + INDEX_SUFFIX)
+
+
+def _file_source(filepath: Path) -> dict:
+    stat = filepath.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def write_index(filepath: Union[str, Path], metadata: dict, offsets: array) -> None:
+    """Save the offset index of a papers file (skipped if read-only).
+
+    Args:
+        filepath: Papers file the offsets belong to (already written).
+        metadata: Query metadata (query, fetched_at).
+        offsets: Start and end byte offset of each paper record, flattened.
+    """
+    filepath = Path(filepath)
+    path = index_path(filepath)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        header = {
+            "format": INDEX_FORMAT,
+            "source": _file_source(filepath),
+            "metadata": metadata,
+        }
+        with open(tmp_path, "wb") as f:
+            f.write(json_codec.dumps(header))
+            f.write(b"\n")
+            f.write(offsets.tobytes())
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def read_index(filepath: Union[str, Path]) -> Optional[tuple[dict, array]]:
+    """Load the offset index of a papers file if it matches the file.
+
+    Args:
+        filepath: Papers file.
+
+    Returns:
+        Tuple of (metadata, offsets), or None if there is no index or the
+        file changed since it was written.
+    """
+    filepath = Path(filepath)
+    try:
+        with open(index_path(filepath), "rb") as f:
+            header = json_codec.loads(f.readline())
+            if (header.get("format") != INDEX_FORMAT
+                    or header.get("source") != _file_source(filepath)):
+                return None
+            offsets = array("q")
+            offsets.frombytes(f.read())
+    except (OSError, ValueError):
+        return None
+    return header["metadata"], offsets
+
+
+def write_json_papers(
+    filepath: Union[str, Path],
+    metadata: dict,
+    records: Iterable[dict],
+    indent: bool = False
+) -> int:
+    """Write a JSON papers file and its offset index.
+
+    The output is byte-for-byte what ``json_codec.dump_file`` writes for
+    ``{**metadata, "papers": records}``, but each record is serialized
+    separately so its position in the file is known.
+
+    Args:
+        filepath: Output file path.
+        metadata: Top-level fields (query, fetched_at, count).
+        records: Paper dicts.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        Number of records written.
+    """
+    head = json_codec.dumps({**metadata, "papers": []}, indent=indent)
+    split = head.rindex(b"[]") + 1
+    if indent:
+        first, separator, last = b"\n    ", b",\n    ", b"\n  "
+    else:
+        first, separator, last = b"", b",", b""
+
+    offsets = array("q")
+    with open(filepath, "wb") as f:
+        f.write(head[:split])
+        pos = split
+        for record in records:
+            data = json_codec.dumps(record, indent=indent)
+            if indent:
+                data = data.replace(b"\n", b"\n    ")
+            prefix = separator if offsets else first
+            f.write(prefix)
+            f.write(data)
+            pos += len(prefix)
+            offsets.extend((pos, pos + len(data)))
+            pos += len(data)
+        if offsets:
+            f.write(last)
+        f.write(head[split:])
+
+    write_index(filepath, {
+        "query": metadata.get("query"),
+        "fetched_at": metadata.get("fetched_at"),
+    }, offsets)
+    return len(offsets) // 2
+
+
+class JsonlPaperWriter:
+    """Writes paper records to a JSONL file, flushing after each record.
+
+    The offset index is written when the writer is closed.
+    """
+
+    def __init__(self, filepath: Path, query: str, fetched_at: Optional[str] = None):
+        """Open a JSONL papers file and write its header.
+
+        Args:
+            filepath: Output file path.
+            query: Query used to fetch the papers.
+            fetched_at: ISO timestamp of the run (defaults to now).
+        """
+        self.filepath = Path(filepath)
+        self.count = 0
+        self.metadata = {
+            "query": query,
+            "fetched_at": fetched_at or datetime.now().isoformat(),
+        }
+        self._offsets = array("q")
+        self._pos = 0
+        self._file = open(self.filepath, "wb")
+        self._write({"format": JSONL_FORMAT, **self.metadata})
+
+    def _write(self, record: dict) -> None:
+        data = json_codec.dumps(record)
+        self._file.write(data)
+        self._file.write(b"\n")
+        self._file.flush()
+        self._pos += len(data) + 1
+
+    def write(self, record: dict) -> None:
+        """Append one paper record.
+
+        Args:
+            record: Paper dict.
+        """
+        start = self._pos
+        self._write(record)
+        self._offsets.extend((start, self._pos - 1))
+        self.count += 1
+
+    def close(self) -> None:
+        """Close the file and write its offset index."""
+        if self._file.closed:
+            return
+        self._file.close()
+        write_index(self.filepath, self.metadata, self._offsets)
+
+    def __enter__(self) -> "JsonlPaperWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def read_jsonl_header(filepath: str) -> dict:
+    """Read the metadata header of a JSONL papers file.
+
+    Args:
+        filepath: Path to JSONL file.
+
+    Returns:
+        Metadata dict with query and fetched_at.
+    """
+    with open(filepath, "rb") as f:
+        first_line = f.readline()
+    header = json_codec.loads(first_line) if first_line.strip() else {}
+    return {
+        "query": header.get("query"),
+        "fetched_at": header.get("fetched_at"),
+    }
+
+
+def iter_jsonl_records(filepath: str) -> Iterator[dict]:
+    """Stream paper records from a JSONL papers file.
+
+    Reads one line at a time, so memory use does not depend on file size.
+    A truncated last line (from an interrupted write) is skipped.
+
+    Args:
+        filepath: Path to JSONL file.
+
+    Yields:
+        Paper dicts, in file order.
+    """
+    with open(filepath, "rb") as f:
+        f.readline()  # header
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json_codec.loads(line)
+            except ValueError:
+                break
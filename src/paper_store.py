@@ -0,0 +1,315 @@
+"""SQLite-backed paper store keyed by Scopus ID."""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .paper_fetcher import Paper, parse_year
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    scopus_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    abstract TEXT,
+    authors TEXT NOT NULL,
+    publication_name TEXT,
+    publication_date TEXT,
+    year INTEGER,
+    citation_count INTEGER NOT NULL DEFAULT 0,
+    doi TEXT,
+    keywords TEXT NOT NULL,
+    url TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_papers_doi ON papers (doi COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_papers_year ON papers (year);
+CREATE INDEX IF NOT EXISTS idx_papers_citation_count ON papers (citation_count);
+CREATE INDEX IF NOT EXISTS idx_papers_publication_name ON papers (publication_name);
+
+CREATE TABLE IF NOT EXISTS query_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    query TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_query_runs_query ON query_runs (query);
+
+CREATE TABLE IF NOT EXISTS run_papers (
+    run_id INTEGER NOT NULL REFERENCES query_runs (id) ON DELETE CASCADE,
+    scopus_id TEXT NOT NULL REFERENCES papers (scopus_id),
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (run_id, scopus_id)
+);
+CREATE INDEX IF NOT EXISTS idx_run_papers_scopus_id ON run_papers (scopus_id);
+"""
+
+# File suffixes treated as paper store databases by the loaders
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+PAPER_COLUMNS = (
+    "scopus_id, title, abstract, authors, publication_name, publication_date, "
+    "citation_count, doi, keywords, url"
+)
+
+
+class PaperStore:
+    """Stores papers and query-run provenance in a SQLite database.
+
+    Each paper is stored once, keyed by Scopus ID, and updated in place when
+    it is fetched again. Every fetch is recorded as a query run that lists
+    the papers it returned in rank order. DOI, year, citation count and
+    publication name are indexed, so deduplication and filtering are
+    indexed lookups rather than full JSON parses.
+
+    Example:
+        with PaperStore("data/papers.db") as store:
+            run_id = store.add_papers(papers, query)
+            recent = store.query(year_from=2020, min_citations=10)
+    """
+
+    def __init__(self, db_path: str = "data/papers.db"):
+        """Initialize paper store.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing).
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "PaperStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _row_to_paper(row: tuple) -> Paper:
+        return Paper(
+            scopus_id=row[0],
+            title=row[1],
+            abstract=row[2],
+            authors=json.loads(row[3]),
+            publication_name=row[4],
+            publication_date=row[5],
+            citation_count=row[6],
+            doi=row[7],
+            keywords=json.loads(row[8]),
+            url=row[9],
+        )
+
+    def add_papers(
+        self,
+        papers: list[Paper],
+        query: str,
+        fetched_at: Optional[str] = None
+    ) -> int:
+        """Upsert papers and record the query run that produced them.
+
+        Args:
+            papers: Papers in result order.
+            query: Query used to fetch the papers.
+            fetched_at: ISO timestamp of the run (defaults to now).
+
+        Returns:
+            ID of the recorded query run.
+        """
+        fetched_at = fetched_at or datetime.now().isoformat()
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO query_runs (query, fetched_at, count) VALUES (?, ?, ?)",
+                (query, fetched_at, len(papers))
+            )
+            run_id = cursor.lastrowid
+
+            self.conn.executemany(
+                "INSERT INTO papers (scopus_id, title, abstract, authors, "
+                "publication_name, publication_date, year, citation_count, doi, "
+                "keywords, url, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (scopus_id) DO UPDATE SET "
+                "title = excluded.title, abstract = excluded.abstract, "
+                "authors = excluded.authors, "
+                "publication_name = excluded.publication_name, "
+                "publication_date = excluded.publication_date, "
+                "year = excluded.year, citation_count = excluded.citation_count, "
+                "doi = excluded.doi, keywords = excluded.keywords, "
+                "url = excluded.url, updated_at = excluded.updated_at",
+                [
+                    (
+                        p.scopus_id, p.title, p.abstract,
+                        json.dumps(p.authors, ensure_ascii=False),
+                        p.publication_name, p.publication_date,
+                        parse_year(p.publication_date), p.citation_count, p.doi,
+                        json.dumps(p.keywords, ensure_ascii=False),
+                        p.url, fetched_at,
+                    )
+                    for p in papers
+                ]
+            )
+
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO run_papers (run_id, scopus_id, rank) "
+                "VALUES (?, ?, ?)",
+                [(run_id, p.scopus_id, rank) for rank, p in enumerate(papers)]
+            )
+
+        return run_id
+
+    def get(self, scopus_id: str) -> Optional[Paper]:
+        """Get a paper by Scopus ID.
+
+        Args:
+            scopus_id: Scopus ID of the paper.
+
+        Returns:
+            Paper, or None if not stored.
+        """
+        row = self.conn.execute(
+            f"SELECT {PAPER_COLUMNS} FROM papers WHERE scopus_id = ?",
+            (scopus_id,)
+        ).fetchone()
+        return self._row_to_paper(row) if row else None
+
+    def get_by_doi(self, doi: str) -> Optional[Paper]:
+        """Get a paper by DOI (case-insensitive).
+
+        Args:
+            doi: Digital Object Identifier.
+
+        Returns:
+            Paper, or None if not stored.
+        """
+        row = self.conn.execute(
+            f"SELECT {PAPER_COLUMNS} FROM papers WHERE doi = ? COLLATE NOCASE",
+            (doi,)
+        ).fetchone()
+        return self._row_to_paper(row) if row else None
+
+    def __contains__(self, scopus_id: str) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM papers WHERE scopus_id = ?", (scopus_id,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def query(
+        self,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        min_citations: Optional[int] = None,
+        publication_name: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> list[Paper]:
+        """Filter stored papers, most cited first.
+
+        Args:
+            year_from: Minimum publication year (inclusive).
+            year_to: Maximum publication year (inclusive).
+            min_citations: Minimum citation count.
+            publication_name: Exact publication name.
+            limit: Maximum number of papers to return.
+
+        Returns:
+            Matching papers sorted by citation count descending.
+        """
+        conditions = []
+        params = []
+        if year_from is not None:
+            conditions.append("year >= ?")
+            params.append(year_from)
+        if year_to is not None:
+            conditions.append("year <= ?")
+            params.append(year_to)
+        if min_citations is not None:
+            conditions.append("citation_count >= ?")
+            params.append(min_citations)
+        if publication_name is not None:
+            conditions.append("publication_name = ?")
+            params.append(publication_name)
+
+        sql = f"SELECT {PAPER_COLUMNS} FROM papers"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY citation_count DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [self._row_to_paper(row) for row in self.conn.execute(sql, params)]
+
+    def list_runs(self, query: Optional[str] = None) -> list[dict]:
+        """List recorded query runs, newest first.
+
+        Args:
+            query: Only list runs of this exact query.
+
+        Returns:
+            List of dicts with id, query, fetched_at and count.
+        """
+        sql = "SELECT id, query, fetched_at, count FROM query_runs"
+        params = []
+        if query is not None:
+            sql += " WHERE query = ?"
+            params.append(query)
+        sql += " ORDER BY id DESC"
+
+        return [
+            {"id": row[0], "query": row[1], "fetched_at": row[2], "count": row[3]}
+            for row in self.conn.execute(sql, params)
+        ]
+
+    def load_run(self, run_id: Optional[int] = None) -> tuple[dict, list[Paper]]:
+        """Load the papers of a query run in their original order.
+
+        Args:
+            run_id: Run ID (defaults to the latest run).
+
+        Returns:
+            Tuple of (metadata dict, list of Papers), like
+            PaperFetcher.load_papers.
+
+        Raises:
+            KeyError: If the run does not exist.
+        """
+        if run_id is None:
+            row = self.conn.execute(
+                "SELECT id, query, fetched_at, count FROM query_runs "
+                "ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT id, query, fetched_at, count FROM query_runs WHERE id = ?",
+                (run_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No query run found: {run_id}")
+
+        columns = ", ".join(f"p.{c.strip()}" for c in PAPER_COLUMNS.split(","))
+        rows = self.conn.execute(
+            f"SELECT {columns} FROM run_papers r "
+            "JOIN papers p ON p.scopus_id = r.scopus_id "
+            "WHERE r.run_id = ? ORDER BY r.rank",
+            (row[0],)
+        )
+        papers = [self._row_to_paper(r) for r in rows]
+
+        metadata = {
+            "query": row[1],
+            "fetched_at": row[2],
+            "count": row[3],
+        }
+        return metadata, papers
@@ -2,14 +2,49 @@
 
 import os
 import re
+import socket
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .dedup_index import DedupIndex
+from .negative_cache import NegativeCache, failure_class
 from .paper_fetcher import Paper
+from .rate_limiter import HostLimiter, RateLimiter
+from .retry import RetryPolicy
+from .source_router import SourceRouter
+
+# Display names of the download sources, by source name
+SOURCE_LABELS = {
+    "elsevier": "Elsevier",
+    "springer": "Springer",
+    "unpaywall": "Unpaywall",
+}
+
+
+class DownloadCancelled(requests.exceptions.RequestException):
+    """Raised inside a hedged source attempt after another source won."""
+
+
+def _abort_response(response: requests.Response) -> None:
+    """Close a streamed response, waking a thread blocked reading its body.
+
+    Closing alone does not interrupt a pending socket read, so the
+    connection is shut down first.
+    """
+    sock = getattr(getattr(response.raw, "_connection", None), "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    response.close()
 
 
 @dataclass
@@ -20,7 +55,7 @@ class DownloadResult:
     success: bool
     filepath: Optional[Path] = None
     error: Optional[str] = None
-    source: Optional[str] = None  # e.g., "elsevier", "unpaywall", "cached"
+    source: Optional[str] = None  # e.g., "elsevier", "unpaywall", "cached", "negative_cache"
 
 
 class PDFDownloader:
@@ -47,7 +82,16 @@ class PDFDownloader:
         timeout: int = 60,
         use_elsevier: bool = True,
         use_springer: bool = True,
-        use_unpaywall: bool = True
+        use_unpaywall: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        dedup_index: Optional[DedupIndex] = None,
+        max_workers: int = 1,
+        pool_size: Optional[int] = None,
+        host_limiter: Optional[HostLimiter] = None,
+        router: Optional[SourceRouter] = None,
+        hedged: bool = False,
+        negative_cache: Optional[NegativeCache] = None
     ):
         """Initialize PDF downloader.
 
@@ -60,6 +104,28 @@ class PDFDownloader:
             use_elsevier: Whether to try Elsevier API first.
             use_springer: Whether to try Springer API.
             use_unpaywall: Whether to use Unpaywall as fallback.
+            rate_limiter: Limiter for Elsevier API calls. Share it with
+                ScopusClient when both use the same API key.
+            retry_policy: Retry policy for transient failures (429/5xx,
+                connection errors). Defaults to RetryPolicy().
+            dedup_index: Optional cross-run dedup index. A paper whose
+                duplicate (same Scopus ID, DOI or normalized title) was
+                already downloaded reuses that PDF.
+            max_workers: Default number of papers download_papers fetches
+                concurrently (1 = serial).
+            pool_size: HTTP connection pool size (defaults to max(10, max_workers)).
+            host_limiter: Per-host concurrency caps and request spacing.
+                Defaults to HostLimiter() with DEFAULT_HOST_LIMITS.
+            router: Optional SourceRouter that reorders or skips sources per
+                DOI prefix and learns from each outcome. Without it every
+                enabled source is tried in the default order.
+            hedged: Try all routed sources of a paper at once, each into
+                its own temp file, and keep the first valid PDF. Cuts tail
+                latency when one source stalls, at the cost of extra
+                requests.
+            negative_cache: Optional NegativeCache. Sources that recently
+                failed for a DOI are skipped, and new failures are recorded
+                with their class (forbidden, not_found, timeout, ...).
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
@@ -71,11 +137,93 @@ class PDFDownloader:
         self.use_elsevier = use_elsevier and bool(self.api_key)
         self.use_springer = use_springer and bool(self.springer_api_key)
         self.use_unpaywall = use_unpaywall
-
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.dedup_index = dedup_index
+        self.max_workers = max(1, max_workers)
+        self.host_limiter = host_limiter or HostLimiter()
+        self.router = router
+        self.hedged = hedged
+        self.negative_cache = negative_cache
+        self._local = threading.local()
+
+        self.pool_size = pool_size or max(10, self.max_workers)
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "PaperSearch/1.0 (Academic Research Tool)"
         })
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _get(
+        self,
+        url: str,
+        rate_limited: bool = False,
+        **kwargs
+    ) -> requests.Response:
+        """Send a GET request through the session with retries.
+
+        Args:
+            url: Request URL.
+            rate_limited: Whether to draw from the Elsevier rate limiter.
+            **kwargs: Extra arguments for requests.Session.get.
+
+        Returns:
+            Response of the last attempt.
+        """
+        def send() -> requests.Response:
+            self._check_cancelled()
+            if rate_limited:
+                self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=self.timeout, **kwargs)
+            in_flight = getattr(self._local, "in_flight", None)
+            if in_flight is not None:
+                # Let _download_hedged abort the body read if this attempt loses
+                in_flight.append(response)
+                try:
+                    self._check_cancelled()
+                except DownloadCancelled:
+                    response.close()
+                    raise
+            if rate_limited:
+                self.rate_limiter.update(response)
+            return response
+
+        try:
+            response = self.retry_policy.call(send)
+        except requests.exceptions.Timeout:
+            self._local.failure = "timeout"
+            raise
+        except requests.exceptions.ConnectionError:
+            self._local.failure = "error"
+            raise
+        self._local.failure = failure_class(response.status_code)
+        return response
+
+    def _host_slot(self, url: str) -> ContextManager[None]:
+        """Get a host_limiter slot, spaced by this thread's download_papers delay."""
+        return self.host_limiter.slot(url, getattr(self._local, "min_interval", None))
+
+    def _check_cancelled(self) -> None:
+        """Raise DownloadCancelled if this thread's hedged attempt lost."""
+        cancel = getattr(self._local, "cancel", None)
+        if cancel is not None and cancel.is_set():
+            raise DownloadCancelled("Another source already returned the PDF")
+
+    def _iter_content(self, response: requests.Response) -> Iterator[bytes]:
+        """Iterate over a response body, stopping if the attempt is cancelled."""
+        try:
+            for chunk in response.iter_content(chunk_size=8192):
+                self._check_cancelled()
+                yield chunk
+        except requests.exceptions.ConnectionError:
+            # Read timeouts and dropped connections mid-body
+            self._local.failure = "error"
+            raise
 
     def sanitize_filename(self, title: str, max_length: int = 100) -> str:
         """Create a safe filename from paper title.
@@ -117,69 +265,70 @@ class PDFDownloader:
             "Accept": "application/pdf"
         }
 
-        try:
-            response = self.session.get(
-                url,
-                headers=headers,
-                timeout=self.timeout,
-                stream=True,
-                allow_redirects=True
-            )
-
-            # Check for successful response
-            if response.status_code == 200:
-                content_type = response.headers.get("Content-Type", "")
-
-                # Verify it's actually a PDF
-                if "pdf" in content_type.lower() or "octet-stream" in content_type.lower():
-                    with open(filepath, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+        with self._host_slot(url):
+            try:
+                response = self._get(
+                    url,
+                    rate_limited=True,
+                    headers=headers,
+                    stream=True,
+                    allow_redirects=True
+                )
 
-                    # Verify file size
-                    if filepath.stat().st_size > 1000:
-                        return "elsevier"
-                    else:
-                        filepath.unlink()
-                        return None
-                else:
-                    # Check for PDF magic bytes
-                    first_bytes = b""
-                    for chunk in response.iter_content(chunk_size=8):
-                        first_bytes = chunk
-                        break
+                # Check for successful response
+                if response.status_code == 200:
+                    content_type = response.headers.get("Content-Type", "")
 
-                    if first_bytes.startswith(b"%PDF"):
+                    # Verify it's actually a PDF
+                    if "pdf" in content_type.lower() or "octet-stream" in content_type.lower():
                         with open(filepath, "wb") as f:
-                            f.write(first_bytes)
-                            for chunk in response.iter_content(chunk_size=8192):
+                            for chunk in self._iter_content(response):
                                 if chunk:
                                     f.write(chunk)
 
+                        # Verify file size
                         if filepath.stat().st_size > 1000:
                             return "elsevier"
                         else:
                             filepath.unlink()
                             return None
+                    else:
+                        # Check for PDF magic bytes
+                        first_bytes = b""
+                        for chunk in response.iter_content(chunk_size=8):
+                            first_bytes = chunk
+                            break
+
+                        if first_bytes.startswith(b"%PDF"):
+                            with open(filepath, "wb") as f:
+                                f.write(first_bytes)
+                                for chunk in self._iter_content(response):
+                                    if chunk:
+                                        f.write(chunk)
+
+                            if filepath.stat().st_size > 1000:
+                                return "elsevier"
+                            else:
+                                filepath.unlink()
+                                return None
+
+                # Handle specific error codes
+                elif response.status_code == 401:
+                    # Authentication issue
+                    return None
+                elif response.status_code == 403:
+                    # No access (subscription required or IP not authorized)
+                    return None
+                elif response.status_code == 404:
+                    # Article not found
+                    return None
 
-            # Handle specific error codes
-            elif response.status_code == 401:
-                # Authentication issue
                 return None
-            elif response.status_code == 403:
-                # No access (subscription required or IP not authorized)
-                return None
-            elif response.status_code == 404:
-                # Article not found
-                return None
-
-            return None
 
-        except requests.exceptions.RequestException:
-            if filepath.exists():
-                filepath.unlink()
-            return None
+            except requests.exceptions.RequestException:
+                if filepath.exists():
+                    filepath.unlink()
+                return None
 
     def get_springer_pdf_url(self, doi: str) -> Optional[dict]:
         """Get PDF URL from Springer Meta API.
@@ -200,11 +349,8 @@ class PDFDownloader:
         }
 
         try:
-            response = self.session.get(
-                self.SPRINGER_META_API,
-                params=params,
-                timeout=self.timeout
-            )
+            with self._host_slot(self.SPRINGER_META_API):
+                response = self._get(self.SPRINGER_META_API, params=params)
 
             if response.status_code != 200:
                 return None
@@ -262,52 +408,52 @@ class PDFDownloader:
         # Try direct PDF URL pattern first (more reliable)
         pdf_url = f"{self.SPRINGER_PDF_BASE}/{doi}.pdf"
 
-        try:
-            response = self.session.get(
-                pdf_url,
-                timeout=self.timeout,
-                stream=True,
-                allow_redirects=True
-            )
-
-            if response.status_code == 200:
-                content_type = response.headers.get("Content-Type", "")
+        with self._host_slot(pdf_url):
+            try:
+                response = self._get(
+                    pdf_url,
+                    stream=True,
+                    allow_redirects=True
+                )
 
-                # Verify it's a PDF
-                if "pdf" in content_type.lower():
-                    with open(filepath, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                if response.status_code == 200:
+                    content_type = response.headers.get("Content-Type", "")
 
-                    # Verify file size
-                    if filepath.stat().st_size > 1000:
-                        return "springer"
-                    else:
-                        filepath.unlink()
-                        return None
-                else:
-                    # Check for PDF magic bytes
-                    first_bytes = next(response.iter_content(chunk_size=8), b"")
-                    if first_bytes.startswith(b"%PDF"):
+                    # Verify it's a PDF
+                    if "pdf" in content_type.lower():
                         with open(filepath, "wb") as f:
-                            f.write(first_bytes)
-                            for chunk in response.iter_content(chunk_size=8192):
+                            for chunk in self._iter_content(response):
                                 if chunk:
                                     f.write(chunk)
 
+                        # Verify file size
                         if filepath.stat().st_size > 1000:
                             return "springer"
                         else:
                             filepath.unlink()
                             return None
+                    else:
+                        # Check for PDF magic bytes
+                        first_bytes = next(response.iter_content(chunk_size=8), b"")
+                        if first_bytes.startswith(b"%PDF"):
+                            with open(filepath, "wb") as f:
+                                f.write(first_bytes)
+                                for chunk in self._iter_content(response):
+                                    if chunk:
+                                        f.write(chunk)
+
+                            if filepath.stat().st_size > 1000:
+                                return "springer"
+                            else:
+                                filepath.unlink()
+                                return None
 
-            return None
+                return None
 
-        except requests.exceptions.RequestException:
-            if filepath.exists():
-                filepath.unlink()
-            return None
+            except requests.exceptions.RequestException:
+                if filepath.exists():
+                    filepath.unlink()
+                return None
 
     def get_unpaywall_pdf_url(self, doi: str) -> Optional[dict]:
         """Get PDF URL from Unpaywall API.
@@ -325,7 +471,8 @@ class PDFDownloader:
         params = {"email": self.email}
 
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            with self._host_slot(url):
+                response = self._get(url, params=params)
 
             if response.status_code == 404:
                 return None
@@ -368,46 +515,46 @@ class PDFDownloader:
         Returns:
             True if download succeeded, False otherwise.
         """
-        try:
-            response = self.session.get(
-                url,
-                timeout=self.timeout,
-                stream=True,
-                allow_redirects=True
-            )
-            response.raise_for_status()
+        with self._host_slot(url):
+            try:
+                response = self._get(
+                    url,
+                    stream=True,
+                    allow_redirects=True
+                )
+                response.raise_for_status()
 
-            # Check content type
-            content_type = response.headers.get("Content-Type", "")
-            if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
-                # Try to detect PDF magic bytes
-                first_bytes = next(response.iter_content(chunk_size=8), b"")
-                if not first_bytes.startswith(b"%PDF"):
-                    return False
+                # Check content type
+                content_type = response.headers.get("Content-Type", "")
+                if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
+                    # Try to detect PDF magic bytes
+                    first_bytes = next(response.iter_content(chunk_size=8), b"")
+                    if not first_bytes.startswith(b"%PDF"):
+                        return False
 
-                # Write the first bytes we read
-                with open(filepath, "wb") as f:
-                    f.write(first_bytes)
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-            else:
-                with open(filepath, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-
-            # Verify file is not empty
-            if filepath.stat().st_size < 1000:
-                filepath.unlink()
-                return False
+                    # Write the first bytes we read
+                    with open(filepath, "wb") as f:
+                        f.write(first_bytes)
+                        for chunk in self._iter_content(response):
+                            if chunk:
+                                f.write(chunk)
+                else:
+                    with open(filepath, "wb") as f:
+                        for chunk in self._iter_content(response):
+                            if chunk:
+                                f.write(chunk)
 
-            return True
+                # Verify file is not empty
+                if filepath.stat().st_size < 1000:
+                    filepath.unlink()
+                    return False
 
-        except Exception:
-            if filepath.exists():
-                filepath.unlink()
-            return False
+                return True
+
+            except Exception:
+                if filepath.exists():
+                    filepath.unlink()
+                return False
 
     def download_paper(self, paper: Paper, filename: Optional[str] = None) -> DownloadResult:
         """Download PDF for a single paper.
@@ -417,6 +564,8 @@ class PDFDownloader:
         2. Springer Nature API (if enabled and API key available)
         3. Unpaywall API (open access fallback)
 
+        With a router, sources are reordered or skipped per DOI prefix.
+
         Args:
             paper: Paper object with metadata.
             filename: Optional custom filename (without extension).
@@ -431,13 +580,39 @@ class PDFDownloader:
                 error="No DOI available"
             )
 
-        # Generate filename
-        if filename:
-            safe_filename = self.sanitize_filename(filename)
-        else:
-            safe_filename = self.sanitize_filename(paper.title)
+        if self.dedup_index is not None:
+            existing = self.dedup_index.get_pdf_path(paper)
+            if existing is not None:
+                return DownloadResult(
+                    paper=paper,
+                    success=True,
+                    filepath=existing,
+                    source="cached"
+                )
+
+        result = self._download_paper(paper, filename)
+
+        if result.success and self.dedup_index is not None:
+            self.dedup_index.set_pdf_path(paper, result.filepath)
+
+        return result
+
+    def pdf_path(self, paper: Paper, filename: Optional[str] = None) -> Path:
+        """Get the path a paper's PDF is saved to.
+
+        Args:
+            paper: Paper object.
+            filename: Optional custom filename (without extension).
+
+        Returns:
+            Path inside download_dir.
+        """
+        safe_filename = self.sanitize_filename(filename or paper.title)
+        return self.download_dir / f"{safe_filename}.pdf"
 
-        filepath = self.download_dir / f"{safe_filename}.pdf"
+    def _download_paper(self, paper: Paper, filename: Optional[str]) -> DownloadResult:
+        """Download a paper with a DOI through the source cascade (see download_paper)."""
+        filepath = self.pdf_path(paper, filename)
 
         # Check if already downloaded
         if filepath.exists():
@@ -448,20 +623,25 @@ class PDFDownloader:
                 source="cached"
             )
 
-        # Try Elsevier first (for subscribed content)
-        if self.use_elsevier:
-            source = self.download_from_elsevier(paper.doi, filepath)
-            if source:
+        names = self.source_order(paper.doi)
+        if self.negative_cache is not None:
+            live = [n for n in names if not self.negative_cache.is_dead(paper.doi, n)]
+            if names and not live:
                 return DownloadResult(
                     paper=paper,
-                    success=True,
-                    filepath=filepath,
-                    source=source
+                    success=False,
+                    error="PDF not available (all sources failed recently)",
+                    source="negative_cache"
                 )
+            names = live
 
-        # Try Springer (for Springer publications)
-        if self.use_springer:
-            source = self.download_from_springer(paper.doi, filepath)
+        if self.hedged:
+            return self._download_hedged(paper, filepath, names)
+
+        sources_tried = []
+        for name in names:
+            source = self._attempt_source(name, paper.doi, filepath)
+            sources_tried.append(SOURCE_LABELS[name])
             if source:
                 return DownloadResult(
                     paper=paper,
@@ -470,29 +650,8 @@ class PDFDownloader:
                     source=source
                 )
 
-        # Try Unpaywall (open access)
-        if self.use_unpaywall:
-            unpaywall_result = self.get_unpaywall_pdf_url(paper.doi)
-            if unpaywall_result:
-                pdf_url = unpaywall_result["pdf_url"]
-                if self.download_pdf(pdf_url, filepath):
-                    return DownloadResult(
-                        paper=paper,
-                        success=True,
-                        filepath=filepath,
-                        source=f"unpaywall:{unpaywall_result['source']}"
-                    )
-
         # All sources failed
         error_msg = "PDF not available"
-        sources_tried = []
-        if self.use_elsevier:
-            sources_tried.append("Elsevier")
-        if self.use_springer:
-            sources_tried.append("Springer")
-        if self.use_unpaywall:
-            sources_tried.append("Unpaywall")
-
         if sources_tried:
             error_msg = f"PDF not available via {', '.join(sources_tried)}"
 
@@ -502,22 +661,175 @@ class PDFDownloader:
             error=error_msg
         )
 
+    def _download_hedged(
+        self,
+        paper: Paper,
+        filepath: Path,
+        names: list[str]
+    ) -> DownloadResult:
+        """Race all routed sources for a paper; the first valid PDF wins.
+
+        Each source downloads into its own ``<name>.<source>.part`` file.
+        The winner is renamed to filepath; the other attempts are cancelled
+        at their next request or body chunk and delete their temp files.
+        Responses the losers are still reading are aborted, so an attempt
+        stalled on a socket read releases its worker, connection and host
+        slot right away instead of waiting for the read timeout.
+        """
+        if not names:
+            return DownloadResult(paper=paper, success=False, error="PDF not available")
+
+        cancel = threading.Event()
+        in_flight: list[requests.Response] = []
+        min_interval = getattr(self._local, "min_interval", None)
+
+        def attempt(name: str, part_path: Path) -> Optional[str]:
+            self._local.cancel = cancel
+            self._local.in_flight = in_flight
+            self._local.min_interval = min_interval
+            try:
+                return self._attempt_source(name, paper.doi, part_path)
+            finally:
+                self._local.cancel = None
+                self._local.in_flight = None
+                self._local.min_interval = None
+
+        def remove_part(part_path: Path) -> None:
+            if part_path.exists():
+                part_path.unlink()
+
+        executor = ThreadPoolExecutor(max_workers=len(names))
+        pending: dict[Future, Path] = {}
+        for name in names:
+            part_path = filepath.with_name(f"{filepath.stem}.{name}.part")
+            pending[executor.submit(attempt, name, part_path)] = part_path
+
+        winner = None
+        try:
+            while pending and winner is None:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    part_path = pending.pop(future)
+                    source = future.result()
+                    if source and winner is None:
+                        os.replace(part_path, filepath)
+                        winner = source
+                    else:
+                        remove_part(part_path)
+        finally:
+            cancel.set()
+            if pending:
+                for response in list(in_flight):
+                    _abort_response(response)
+            for future, part_path in pending.items():
+                future.add_done_callback(lambda _, p=part_path: remove_part(p))
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if winner:
+            return DownloadResult(
+                paper=paper,
+                success=True,
+                filepath=filepath,
+                source=winner
+            )
+
+        return DownloadResult(
+            paper=paper,
+            success=False,
+            error=f"PDF not available via {', '.join(SOURCE_LABELS[n] for n in names)}"
+        )
+
+    @property
+    def enabled_sources(self) -> list[str]:
+        """Enabled sources in default cascade order."""
+        return [
+            name for name, enabled in (
+                ("elsevier", self.use_elsevier),
+                ("springer", self.use_springer),
+                ("unpaywall", self.use_unpaywall),
+            ) if enabled
+        ]
+
+    def source_order(self, doi: str) -> list[str]:
+        """Get the sources to try for a DOI, routed by self.router if set."""
+        if self.router is None:
+            return self.enabled_sources
+        return self.router.route(doi, self.enabled_sources)
+
+    def _attempt_source(self, name: str, doi: str, filepath: Path) -> Optional[str]:
+        """Try one source and record the outcome in the router and negative cache.
+
+        Outcomes of hedged attempts cancelled by another source are not
+        recorded.
+        """
+        self._local.failure = None
+        source = self._try_source(name, doi, filepath)
+
+        cancel = getattr(self._local, "cancel", None)
+        if cancel is not None and cancel.is_set():
+            return source
+
+        outcome = self._local.failure or "unavailable"
+        if self.router is not None:
+            self.router.record(doi, name, source is not None, outcome)
+        if self.negative_cache is not None:
+            if source:
+                self.negative_cache.record_success(doi, name)
+            else:
+                self.negative_cache.record_failure(doi, name, outcome)
+        return source
+
+    def _try_source(self, name: str, doi: str, filepath: Path) -> Optional[str]:
+        """Try one source of the cascade.
+
+        Args:
+            name: "elsevier", "springer" or "unpaywall".
+            doi: Digital Object Identifier.
+            filepath: Path to save the PDF.
+
+        Returns:
+            Source string if successful, None otherwise.
+        """
+        if name == "elsevier":
+            return self.download_from_elsevier(doi, filepath)
+        if name == "springer":
+            return self.download_from_springer(doi, filepath)
+
+        unpaywall_result = self.get_unpaywall_pdf_url(doi)
+        if unpaywall_result and self.download_pdf(unpaywall_result["pdf_url"], filepath):
+            return f"unpaywall:{unpaywall_result['source']}"
+        return None
+
     def download_papers(
         self,
         papers: list[Paper],
         delay: float = 1.0,
-        progress_callback: callable = None
+        progress_callback: callable = None,
+        max_workers: Optional[int] = None
     ) -> list[DownloadResult]:
         """Download PDFs for multiple papers.
 
+        With more than one worker, papers are downloaded concurrently,
+        limited per host by host_limiter, and ``delay`` becomes the minimum
+        interval between requests to the same host instead of a global
+        sleep. progress_callback is then called as papers finish, which may
+        differ from input order; ``current`` still counts up from 1.
+
         Args:
             papers: List of Paper objects.
             delay: Delay between downloads (seconds) to be polite to servers.
             progress_callback: Optional callback function(current, total, paper, result).
+            max_workers: Concurrent downloads (defaults to self.max_workers).
 
         Returns:
-            List of DownloadResult objects.
+            List of DownloadResult objects, in the order of papers.
         """
+        max_workers = max_workers or self.max_workers
+        if max_workers > 1 and len(papers) > 1:
+            return self._download_papers_parallel(
+                papers, delay, progress_callback, max_workers
+            )
+
         results = []
         total = len(papers)
 
@@ -528,12 +840,49 @@ class PDFDownloader:
             if progress_callback:
                 progress_callback(i + 1, total, paper, result)
 
-            # Rate limiting (skip if cached)
-            if result.source != "cached" and i < total - 1:
+            # Rate limiting (skip if no request was made)
+            if result.source not in ("cached", "negative_cache") and i < total - 1:
                 time.sleep(delay)
 
         return results
 
+    def _download_papers_parallel(
+        self,
+        papers: list[Paper],
+        delay: float,
+        progress_callback: Optional[callable],
+        max_workers: int
+    ) -> list[DownloadResult]:
+        """Download papers on a thread pool (see download_papers)."""
+        # Papers saved to the same file run in one task, in input order, so
+        # later ones see the earlier download as cached instead of racing it
+        groups: dict[Path, list[int]] = {}
+        for i, paper in enumerate(papers):
+            groups.setdefault(self.pdf_path(paper), []).append(i)
+
+        def run(indices: list[int]) -> list[tuple[int, DownloadResult]]:
+            # Spacing applies to this call only, not to a shared host_limiter
+            self._local.min_interval = delay
+            try:
+                return [(i, self.download_paper(papers[i])) for i in indices]
+            finally:
+                self._local.min_interval = None
+
+        results: list[Optional[DownloadResult]] = [None] * len(papers)
+        total = len(papers)
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, indices) for indices in groups.values()]
+            for future in as_completed(futures):
+                for i, result in future.result():
+                    results[i] = result
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total, papers[i], result)
+
+        return results
+
     def get_download_stats(self, results: list[DownloadResult]) -> dict:
         """Get statistics from download results.
 
@@ -125,12 +125,7 @@ class QueryBuilder:
         query = " AND ".join(parts) if parts else ""
 
         # Add year range
-        if self.year_from and self.year_to:
-            query += f" AND PUBYEAR > {self.year_from - 1} AND PUBYEAR < {self.year_to + 1}"
-        elif self.year_from:
-            query += f" AND PUBYEAR > {self.year_from - 1}"
-        elif self.year_to:
-            query += f" AND PUBYEAR < {self.year_to + 1}"
+        query += year_range_clause(self.year_from, self.year_to)
 
         # Add exclusions
         if self.exclude_terms:
@@ -140,6 +135,27 @@ class QueryBuilder:
         return query.strip()
 
 
+def year_range_clause(
+    year_from: Optional[int] = None, year_to: Optional[int] = None
+) -> str:
+    """Build the PUBYEAR filter appended to a query.
+
+    Args:
+        year_from: Start year (inclusive).
+        year_to: End year (inclusive).
+
+    Returns:
+        Clause starting with " AND ", or an empty string if no year is given.
+    """
+    if year_from and year_to:
+        return f" AND PUBYEAR > {year_from - 1} AND PUBYEAR < {year_to + 1}"
+    elif year_from:
+        return f" AND PUBYEAR > {year_from - 1}"
+    elif year_to:
+        return f" AND PUBYEAR < {year_to + 1}"
+    return ""
+
+
 def build_query_from_topic(
     topic: str,
     additional_terms: Optional[list[str]] = None,
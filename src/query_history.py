@@ -0,0 +1,139 @@
+"""Per-query run history for incremental fetching."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    query_key TEXT PRIMARY KEY,
+    query TEXT NOT NULL,
+    last_run TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS seen_papers (
+    query_key TEXT NOT NULL REFERENCES queries (query_key) ON DELETE CASCADE,
+    scopus_id TEXT NOT NULL,
+    PRIMARY KEY (query_key, scopus_id)
+) WITHOUT ROWID;
+"""
+
+
+def canonical_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share history.
+
+    Scopus queries are case-insensitive, so the key is the lower-cased query
+    with runs of whitespace collapsed.
+
+    Args:
+        query: Scopus query string.
+
+    Returns:
+        Canonical query key.
+    """
+    return " ".join(query.split()).lower()
+
+
+class QueryHistory:
+    """Remembers, per canonical query, the Scopus IDs already seen and the
+    time of the last run.
+
+    Example:
+        history = QueryHistory("data/papers/query_history.db")
+        seen = history.seen_ids(query)
+        history.record_run(query, [p.scopus_id for p in papers], started_at)
+    """
+
+    def __init__(self, db_path: str = "data/papers/query_history.db"):
+        """Initialize query history.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing).
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "QueryHistory":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def last_run(self, query: str) -> Optional[datetime]:
+        """Get the start time of the last recorded run of a query.
+
+        Args:
+            query: Scopus query string.
+
+        Returns:
+            Datetime of the last run, or None if the query was never run.
+        """
+        row = self.conn.execute(
+            "SELECT last_run FROM queries WHERE query_key = ?",
+            (canonical_query(query),)
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def seen_ids(self, query: str) -> set[str]:
+        """Get the Scopus IDs already seen for a query.
+
+        Args:
+            query: Scopus query string.
+
+        Returns:
+            Set of Scopus IDs.
+        """
+        rows = self.conn.execute(
+            "SELECT scopus_id FROM seen_papers WHERE query_key = ?",
+            (canonical_query(query),)
+        )
+        return {row[0] for row in rows}
+
+    def record_run(
+        self,
+        query: str,
+        scopus_ids: Iterable[str],
+        started_at: Optional[datetime] = None,
+        advance_last_run: bool = True
+    ) -> None:
+        """Record a run of a query and the Scopus IDs it returned.
+
+        Args:
+            query: Scopus query string.
+            scopus_ids: Scopus IDs returned by the run.
+            started_at: When the run started (defaults to now).
+            advance_last_run: Whether to move the query's last run time to
+                started_at. Pass False for runs that stopped before seeing
+                every new paper, so the next run's window still covers them.
+                (A query without history always gets started_at.)
+        """
+        key = canonical_query(query)
+        started_at = started_at or datetime.now()
+
+        if advance_last_run:
+            upsert = (
+                "INSERT INTO queries (query_key, query, last_run) VALUES (?, ?, ?) "
+                "ON CONFLICT (query_key) DO UPDATE SET "
+                "query = excluded.query, last_run = excluded.last_run"
+            )
+        else:
+            upsert = (
+                "INSERT INTO queries (query_key, query, last_run) VALUES (?, ?, ?) "
+                "ON CONFLICT (query_key) DO NOTHING"
+            )
+
+        with self.conn:
+            self.conn.execute(upsert, (key, query, started_at.isoformat()))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen_papers (query_key, scopus_id) VALUES (?, ?)",
+                ((key, scopus_id) for scopus_id in scopus_ids if scopus_id)
+            )
@@ -0,0 +1,141 @@
+"""Year-sharded query planning for result sets beyond the pagination limit."""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+
+from .query_builder import year_range_clause
+from .scopus_client import ScopusClient
+
+
+@dataclass
+class QueryShard:
+    """A year-restricted slice of a query and its result count."""
+
+    query: str
+    year_from: int
+    year_to: int
+    count: int
+
+
+class YearShardPlanner:
+    """Splits a query into PUBYEAR shards that each fit the pagination limit.
+
+    The planner probes the result count of the full year range and halves
+    any range whose count exceeds ``limit`` until every shard fits (or spans
+    a single year). Shards are fetched in parallel and merged in year order,
+    so broad queries can be harvested exhaustively.
+
+    Example:
+        planner = YearShardPlanner(client, max_workers=4)
+        shards = planner.plan('TITLE-ABS-KEY("deep learning")', 2015, 2024)
+        entries = list(planner.iter_entries(shards))
+    """
+
+    def __init__(
+        self,
+        client: ScopusClient,
+        limit: int = ScopusClient.MAX_START_OFFSET,
+        min_year: int = 1900,
+        max_workers: int = 4
+    ):
+        """Initialize year shard planner.
+
+        Args:
+            client: Scopus client used for probes and fetches.
+            limit: Maximum result count per shard.
+            min_year: Start year used when the caller gives none.
+            max_workers: Number of concurrent probes and shard fetches.
+        """
+        self.client = client
+        self.limit = limit
+        self.min_year = min_year
+        self.max_workers = max(1, max_workers)
+
+    @staticmethod
+    def shard_query(query: str, year_from: int, year_to: int) -> str:
+        """Restrict a query to a publication year range.
+
+        Args:
+            query: Base Scopus query (without a PUBYEAR filter).
+            year_from: Start year (inclusive).
+            year_to: End year (inclusive).
+
+        Returns:
+            Year-restricted query string.
+        """
+        return f"({query}){year_range_clause(year_from, year_to)}"
+
+    def plan(
+        self,
+        query: str,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None
+    ) -> list[QueryShard]:
+        """Split a query into shards under the pagination limit.
+
+        Args:
+            query: Base Scopus query (without a PUBYEAR filter).
+            year_from: Start year (defaults to min_year).
+            year_to: End year (defaults to the current year).
+
+        Returns:
+            Non-empty shards sorted by year. A single year that still exceeds
+            the limit is returned as one shard.
+        """
+        pending = [(year_from or self.min_year, year_to or datetime.now().year)]
+        shards = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending:
+                queries = [self.shard_query(query, lo, hi) for lo, hi in pending]
+                counts = list(executor.map(self.client.count, queries))
+
+                next_pending = []
+                for (lo, hi), shard_query, count in zip(pending, queries, counts):
+                    if count == 0:
+                        continue
+                    if count <= self.limit or lo == hi:
+                        shards.append(QueryShard(shard_query, lo, hi, count))
+                    else:
+                        mid = (lo + hi) // 2
+                        next_pending.extend([(lo, mid), (mid + 1, hi)])
+                pending = next_pending
+
+        return sorted(shards, key=lambda s: s.year_from)
+
+    def iter_entries(self, shards: list[QueryShard]) -> Iterator[dict]:
+        """Fetch shards in parallel and yield their entries in shard order.
+
+        Args:
+            shards: Shards returned by plan().
+
+        Yields:
+            Search result entries.
+        """
+        shard_iter = iter(shards)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for shard in shard_iter:
+                pending.append(executor.submit(
+                    self.client.search_all, shard.query, shard.count, 1
+                ))
+                if len(pending) >= self.max_workers:
+                    break
+
+            try:
+                while pending:
+                    entries = pending.popleft().result()
+                    next_shard = next(shard_iter, None)
+                    if next_shard is not None:
+                        pending.append(executor.submit(
+                            self.client.search_all,
+                            next_shard.query, next_shard.count, 1
+                        ))
+                    yield from entries
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,241 @@
+"""Adaptive token-bucket rate limiter for Elsevier API requests, and
+per-host concurrency limits for PDF downloads."""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Mapping, Optional
+from urllib.parse import urlparse
+
+# Concurrent connections allowed per host when downloading in parallel.
+# Hosts not listed (e.g. institutional repositories found via Unpaywall)
+# use HostLimiter.max_per_host.
+DEFAULT_HOST_LIMITS = {
+    "api.elsevier.com": 4,
+    "api.springernature.com": 2,
+    "link.springer.com": 2,
+    "api.unpaywall.org": 4,
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Thread-safe token bucket that adapts to Elsevier rate-limit feedback.
+
+    Elsevier reports the remaining quota in ``X-RateLimit-Remaining`` and the
+    epoch second at which it resets in ``X-RateLimit-Reset``. When the quota
+    is exhausted the bucket blocks until the reset time. A 429 response halves
+    the request rate; each successful response raises it again step by step
+    up to ``max_rate``, so concurrent workers settle just under the allowed
+    throughput.
+
+    A single instance can be shared by several clients (e.g. ScopusClient and
+    PDFDownloader) that draw from the same API key, including asyncio
+    clients, which wait with ``acquire_async`` instead of ``acquire``.
+    """
+
+    def __init__(
+        self,
+        rate: float = 9.0,
+        burst: Optional[int] = None,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            rate: Initial requests per second.
+            burst: Bucket capacity. Defaults to the initial rate (at least 1).
+            min_rate: Lower bound for the adaptive rate.
+            max_rate: Upper bound for the adaptive rate (defaults to rate).
+        """
+        self.max_rate = max_rate or rate
+        self.min_rate = min(min_rate, self.max_rate)
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise seconds to wait before retrying.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._blocked_until and self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return max(
+                self._blocked_until - now,
+                (1 - self._tokens) / self.rate
+            )
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        with self._lock:
+            self._blocked_until = max(
+                self._blocked_until, time.monotonic() + seconds
+            )
+            self._tokens = 0.0
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adjust the bucket from X-RateLimit-* response headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping).
+        """
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining"))
+        except (TypeError, ValueError):
+            return
+
+        try:
+            reset_in = float(headers.get("X-RateLimit-Reset")) - time.time()
+        except (TypeError, ValueError):
+            reset_in = None
+
+        if remaining <= 0:
+            self.pause(reset_in if reset_in and reset_in > 0 else 1.0)
+            return
+
+        with self._lock:
+            # Never hand out more tokens than the server says are left
+            self._tokens = min(self._tokens, float(remaining))
+
+    def update(self, response) -> None:
+        """Feed a response back into the limiter.
+
+        Args:
+            response: requests.Response or aiohttp.ClientResponse (any object
+                with headers and a status_code or status attribute).
+        """
+        status = getattr(response, "status_code", None)
+        if status is None:
+            status = response.status
+        self.update_from_headers(response.headers)
+
+        with self._lock:
+            if status == 429:
+                self.rate = max(self.min_rate, self.rate / 2)
+            elif status < 400:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+        if status == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                self.pause(retry_after)
+
+
+class HostLimiter:
+    """Thread-safe per-host concurrency cap and request spacing.
+
+    Each host gets its own semaphore, so a slow repository cannot take up
+    every worker, and request starts to the same host are spaced at least
+    ``min_interval`` seconds apart. Requests to different hosts never wait
+    on each other.
+
+    Example:
+        limiter = HostLimiter(min_interval=1.0)
+        with limiter.slot("https://api.unpaywall.org/v2/10.1000/xyz"):
+            response = session.get(...)
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 2,
+        host_limits: Optional[Mapping[str, int]] = None,
+        min_interval: float = 0.0
+    ):
+        """Initialize host limiter.
+
+        Args:
+            max_per_host: Concurrent requests for hosts not in host_limits.
+            host_limits: Per-host overrides, merged into DEFAULT_HOST_LIMITS.
+            min_interval: Minimum seconds between request starts to one host.
+        """
+        self.max_per_host = max(1, max_per_host)
+        self.host_limits = {**DEFAULT_HOST_LIMITS, **(host_limits or {})}
+        self.min_interval = min_interval
+
+        self._semaphores: dict[str, threading.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                limit = self.host_limits.get(host, self.max_per_host)
+                semaphore = threading.Semaphore(max(1, limit))
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, url: str, min_interval: Optional[float] = None) -> Iterator[None]:
+        """Hold one of the URL's host slots for the duration of the block.
+
+        Args:
+            url: Request URL; only its host name is used.
+            min_interval: Spacing after this request start, overriding
+                self.min_interval for this call.
+        """
+        if min_interval is None:
+            min_interval = self.min_interval
+        host = urlparse(url).hostname or ""
+        with self._semaphore(host):
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
@@ -0,0 +1,148 @@
+"""Persistent on-disk cache for Scopus API responses."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from . import json_codec
+
+
+class ResponseCache:
+    """Content-addressed disk cache for Scopus search pages.
+
+    Each response is stored as ``<sha256>.json`` where the hash is taken over
+    the request parameters (query, start, count, sort, view). Entries older
+    than ``ttl`` seconds are treated as missing. File modification times
+    track recency, and the least recently used entries are evicted once the
+    cache grows beyond ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "data/cache",
+        ttl: Optional[float] = 24 * 60 * 60,
+        max_bytes: int = 200 * 1024 * 1024,
+        refresh: bool = False
+    ):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory to store cached responses.
+            ttl: Time-to-live in seconds (None for no expiry).
+            max_bytes: Maximum total size of cached files.
+            refresh: Ignore existing entries on read but still store new ones.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(params: dict) -> str:
+        """Compute the cache key for a set of request parameters.
+
+        Args:
+            params: Request parameters.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        canonical = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, params: dict) -> Optional[dict]:
+        """Look up a cached response.
+
+        Args:
+            params: Request parameters.
+
+        Returns:
+            Cached response, or None on miss, expiry or refresh.
+        """
+        if self.refresh:
+            return None
+
+        path = self._path(self.make_key(params))
+        try:
+            data = json_codec.load_file(path)
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl is not None and time.time() - data.get("stored_at", 0) > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+
+        # Touch the file so eviction sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data.get("response")
+
+    def put(self, params: dict, response: dict) -> None:
+        """Store a response.
+
+        Args:
+            params: Request parameters.
+            response: Decoded JSON response.
+        """
+        path = self._path(self.make_key(params))
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        data = {"stored_at": time.time(), "params": params, "response": response}
+
+        json_codec.dump_file(data, tmp_path)
+
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += path.stat().st_size - old_size
+            over_limit = self._total_bytes > self.max_bytes
+
+        if over_limit:
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*.json"))
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total > self.max_bytes:
+                entries.sort()
+                for _, size, path in entries:
+                    path.unlink(missing_ok=True)
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+
+            self._total_bytes = total
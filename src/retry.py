@@ -0,0 +1,103 @@
+"""Retry policy with exponential backoff for HTTP requests."""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import requests
+
+from .rate_limiter import parse_retry_after
+
+
+@dataclass
+class RetryPolicy:
+    """Retries transient HTTP failures with exponential backoff and jitter.
+
+    A request is retried when it raises a connection error or timeout, or
+    when the response status is in ``retry_statuses``. The wait before each
+    retry is drawn uniformly from ``[0, min(backoff_max, backoff_base * 2**n)]``
+    ("full jitter"), unless the server sent a ``Retry-After`` header, which is
+    honored instead. Retrying stops after ``max_attempts`` attempts or once
+    the next wait would pass ``deadline`` seconds since the first attempt.
+    """
+
+    max_attempts: int = 5
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    deadline: Optional[float] = 120.0
+    retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    def get_delay(self, attempt: int, response=None) -> float:
+        """Compute the wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far (1-based).
+            response: Failed response, if any.
+
+        Returns:
+            Seconds to sleep.
+        """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def call(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """Call ``send`` until it succeeds or the policy gives up.
+
+        Args:
+            send: Function performing one request attempt.
+
+        Returns:
+            The first non-retryable response, or the last response received
+            when retries are exhausted.
+
+        Raises:
+            requests.exceptions.ConnectionError, requests.exceptions.Timeout:
+                If the final attempt failed with a transport error.
+        """
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout):
+                delay = self.next_delay(attempt, started, None)
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in self.retry_statuses:
+                    return response
+                delay = self.next_delay(attempt, started, response)
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+
+    def next_delay(
+        self, attempt: int, started: float, response=None
+    ) -> Optional[float]:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            attempt: Number of attempts made so far (1-based).
+            started: time.monotonic() value of the first attempt.
+            response: Failed response, or None for a transport error.
+
+        Returns:
+            Seconds to sleep before the next attempt, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.get_delay(attempt, response)
+        if self.deadline is not None:
+            if time.monotonic() - started + delay > self.deadline:
+                return None
+        return delay
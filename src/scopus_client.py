@@ -1,8 +1,17 @@
 """Scopus API client for paper search."""
 
+import itertools
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
 
 
 class ScopusClient:
@@ -10,12 +19,38 @@ class ScopusClient:
 
     BASE_URL = "https://api.elsevier.com/content/search/scopus"
     ABSTRACT_URL = "https://api.elsevier.com/content/abstract/scopus_id"
+    PAGE_SIZE = 25
+    # Scopus rejects start offsets beyond this; deeper results need a cursor
+    MAX_START_OFFSET = 5000
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_workers: int = 1,
+        pool_size: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        view: str = "COMPLETE",
+        fields: Optional[str] = None
+    ):
         """Initialize Scopus client.
 
         Args:
             api_key: Scopus API key. If not provided, reads from SCOPUS_API_KEY env var.
+            max_workers: Default number of concurrent page requests in search_all.
+                1 keeps the serial behaviour.
+            pool_size: Maximum number of keep-alive connections kept per host.
+                Defaults to max(10, max_workers).
+            rate_limiter: Limiter applied to every request. Pass the same
+                instance to PDFDownloader to share one API key's budget.
+            retry_policy: Retry policy for transient failures (429/5xx,
+                connection errors). Defaults to RetryPolicy().
+            cache: Optional on-disk cache for search result pages.
+            view: Default Scopus view for search requests
+                ("STANDARD" or "COMPLETE").
+            fields: Default comma-separated Scopus ``field`` projection
+                for search requests (None returns every field of the view).
         """
         self.api_key = api_key or os.environ.get("SCOPUS_API_KEY")
         if not self.api_key:
@@ -28,41 +63,156 @@ class ScopusClient:
             "X-ELS-APIKey": self.api_key,
             "Accept": "application/json"
         }
+        self.max_workers = max(1, max_workers)
+
+        # One pooled session so consecutive requests reuse TCP/TLS connections
+        self.pool_size = pool_size or max(10, self.max_workers)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.view = view
+        self.fields = fields
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "ScopusClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get(self, url: str, params: dict) -> dict:
+        """Send a rate-limited, retried GET request and decode the JSON body.
+
+        Args:
+            url: Request URL.
+            params: Query parameters.
+
+        Returns:
+            Decoded JSON response.
+        """
+        def send() -> requests.Response:
+            self.rate_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=30)
+            self.rate_limiter.update(response)
+            return response
+
+        response = self.retry_policy.call(send)
+        response.raise_for_status()
+        return response.json()
 
     def search(
         self,
         query: str,
         count: int = 25,
         start: int = 0,
-        sort: str = "-citedby-count"
+        sort: str = "-citedby-count",
+        cursor: Optional[str] = None,
+        view: Optional[str] = None,
+        fields: Optional[str] = None
     ) -> dict:
         """Search Scopus for papers matching query.
 
         Args:
             query: Scopus search query string.
             count: Number of results to return (max 25 per request).
-            start: Starting index for pagination.
+            start: Starting index for pagination (ignored in cursor mode).
             sort: Sort order. Default is by citation count descending.
+            cursor: Deep-pagination cursor ("*" for the first page, then
+                the previous page's ``cursor.@next``).
+            view: Scopus view (defaults to the client's view).
+            fields: Comma-separated field projection
+                (defaults to the client's fields).
 
         Returns:
             Search results as dictionary.
         """
         params = {
             "query": query,
-            "count": min(count, 25),
-            "start": start,
+            "count": min(count, self.PAGE_SIZE),
             "sort": sort,
-            "view": "COMPLETE"
+            "view": view or self.view
+        }
+        fields = fields or self.fields
+        if fields:
+            params["field"] = fields
+        if cursor is not None:
+            # Cursors are short-lived, so cursor pages are never cached
+            params["cursor"] = cursor
+            return self._get(self.BASE_URL, params)
+        params["start"] = start
+
+        if self.cache is not None:
+            cached = self.cache.get(params)
+            if cached is not None:
+                return cached
+
+        result = self._get(self.BASE_URL, params)
+
+        if self.cache is not None:
+            self.cache.put(params, result)
+        return result
+
+    def count(self, query: str) -> int:
+        """Get the number of results matching a query.
+
+        Requests a single entry restricted to its identifier field, so the
+        response is as small as possible; only ``opensearch:totalResults``
+        is read.
+
+        Args:
+            query: Scopus search query string.
+
+        Returns:
+            Total number of matching results.
+        """
+        params = {
+            "query": query,
+            "count": 1,
+            "field": "dc:identifier"
         }
 
-        response = requests.get(
-            self.BASE_URL,
-            headers=self.headers,
-            params=params,
-            timeout=30
+        result = None
+        if self.cache is not None:
+            result = self.cache.get(params)
+        if result is None:
+            result = self._get(self.BASE_URL, params)
+            if self.cache is not None:
+                self.cache.put(params, result)
+
+        return int(
+            result.get("search-results", {}).get("opensearch:totalResults", 0)
         )
-        response.raise_for_status()
-        return response.json()
+
+    def count_many(
+        self,
+        queries: list[str],
+        max_workers: Optional[int] = None
+    ) -> list[int]:
+        """Get result counts for several queries concurrently.
+
+        Args:
+            queries: Scopus search query strings.
+            max_workers: Number of concurrent requests
+                (defaults to the client's max_workers).
+
+        Returns:
+            Result counts in the same order as queries.
+        """
+        workers = self.max_workers if max_workers is None else max(1, max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.count, queries))
 
     def get_abstract(self, scopus_id: str) -> dict:
         """Get full abstract for a paper by Scopus ID.
@@ -76,39 +226,131 @@ class ScopusClient:
         url = f"{self.ABSTRACT_URL}/{scopus_id}"
         params = {"view": "FULL"}
 
-        response = requests.get(
-            url,
-            headers=self.headers,
-            params=params,
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get(url, params)
 
-    def search_all(self, query: str, total_count: int = 100) -> list[dict]:
+    def search_all(
+        self,
+        query: str,
+        total_count: int = 100,
+        max_workers: Optional[int] = None
+    ) -> list[dict]:
         """Search and retrieve multiple pages of results.
 
         Args:
             query: Scopus search query string.
             total_count: Total number of results to retrieve.
+            max_workers: Number of concurrent page requests
+                (defaults to the client's max_workers).
 
         Returns:
             List of all search result entries.
         """
-        all_results = []
+        return list(self.iter_search(query, total_count, max_workers))
+
+    def iter_search(
+        self,
+        query: str,
+        total_count: int = 100,
+        max_workers: Optional[int] = None,
+        sort: str = "-citedby-count"
+    ) -> Iterator[dict]:
+        """Stream search result entries page by page.
+
+        Requests for more than MAX_START_OFFSET results switch to cursor
+        pagination (see search_cursor), which is always serial.
+
+        Otherwise the first page is always fetched on its own to learn
+        ``opensearch:totalResults``. With more than one worker, the remaining
+        page offsets are then requested concurrently, at most a few pages
+        ahead of the consumer, and yielded in order, giving the same result
+        as the serial path.
+
+        Args:
+            query: Scopus search query string.
+            total_count: Total number of results to retrieve.
+            max_workers: Number of concurrent page requests
+                (defaults to the client's max_workers).
+            sort: Sort order.
+
+        Yields:
+            Search result entries.
+        """
+        if total_count > self.MAX_START_OFFSET:
+            yield from self.search_cursor(query, total_count, sort=sort)
+            return
+
+        workers = self.max_workers if max_workers is None else max(1, max_workers)
+        if workers == 1:
+            yield from self._iter_search_serial(query, total_count, sort)
+            return
+
+        first_count = min(self.PAGE_SIZE, total_count)
+        if first_count <= 0:
+            return
+
+        result = self.search(query, count=first_count, start=0, sort=sort)
+        entries = result.get("search-results", {}).get("entry", [])
+        if not entries:
+            return
+
+        yield from entries[:total_count]
+        total_available = int(
+            result.get("search-results", {}).get("opensearch:totalResults", 0)
+        )
+        target = min(total_count, total_available)
+        if len(entries) >= target:
+            return
+
+        pages = iter([
+            (start, min(self.PAGE_SIZE, target - start))
+            for start in range(len(entries), target, self.PAGE_SIZE)
+        ])
+
+        def fetch_page(page: tuple[int, int]) -> list[dict]:
+            start, count = page
+            page_result = self.search(query, count=count, start=start, sort=sort)
+            return page_result.get("search-results", {}).get("entry", [])
+
+        # Keep a bounded window of pages in flight so memory stays flat
+        # even when the consumer is slower than the API.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(
+                executor.submit(fetch_page, page)
+                for page in itertools.islice(pages, workers * 2)
+            )
+            try:
+                while pending:
+                    page_entries = pending.popleft().result()
+                    if not page_entries:
+                        break
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        pending.append(executor.submit(fetch_page, next_page))
+                    yield from page_entries
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _iter_search_serial(
+        self, query: str, total_count: int, sort: str
+    ) -> Iterator[dict]:
+        """Retrieve pages one after another (see iter_search)."""
+        yielded = 0
         start = 0
 
-        while len(all_results) < total_count:
-            remaining = total_count - len(all_results)
-            count = min(25, remaining)
+        while yielded < total_count:
+            remaining = total_count - yielded
+            count = min(self.PAGE_SIZE, remaining)
 
-            result = self.search(query, count=count, start=start)
+            result = self.search(query, count=count, start=start, sort=sort)
             entries = result.get("search-results", {}).get("entry", [])
 
             if not entries:
                 break
 
-            all_results.extend(entries)
+            page = entries[:remaining]
+            yield from page
+            yielded += len(page)
             start += len(entries)
 
             total_available = int(
@@ -117,4 +359,46 @@ class ScopusClient:
             if start >= total_available:
                 break
 
-        return all_results[:total_count]
+    def search_cursor(
+        self,
+        query: str,
+        total_count: int = 100,
+        sort: str = "-citedby-count"
+    ) -> Iterator[dict]:
+        """Stream results using cursor-based deep pagination.
+
+        Unlike start offsets, cursors are not limited to the first
+        MAX_START_OFFSET results. Entries are yielded as each page arrives.
+
+        Args:
+            query: Scopus search query string.
+            total_count: Maximum number of results to yield.
+            sort: Sort order.
+
+        Yields:
+            Search result entries.
+        """
+        cursor = "*"
+        yielded = 0
+
+        while yielded < total_count:
+            count = min(self.PAGE_SIZE, total_count - yielded)
+            result = self.search(query, count=count, sort=sort, cursor=cursor)
+            search_results = result.get("search-results", {})
+            entries = search_results.get("entry", [])
+
+            if not entries:
+                break
+
+            page = entries[:total_count - yielded]
+            yield from page
+            yielded += len(page)
+
+            next_cursor = search_results.get("cursor", {}).get("@next")
+            if not next_cursor or next_cursor == cursor:
+                break
+            cursor = next_cursor
+
+            total_available = int(search_results.get("opensearch:totalResults", 0))
+            if yielded >= total_available:
+                break
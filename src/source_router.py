@@ -0,0 +1,199 @@
+"""DOI-prefix routing of PDF download sources."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .dedup_index import normalize_doi
+
+# Sources that only serve their own publisher's articles
+PUBLISHER_SOURCES = ("elsevier", "springer")
+
+# DOI registrant prefixes of the publishers behind PUBLISHER_SOURCES
+DOI_PREFIX_SOURCES = {
+    "10.1016": "elsevier",  # Elsevier
+    "10.1006": "elsevier",  # Academic Press (Elsevier)
+    "10.1007": "springer",  # Springer
+}
+
+# Failure classes (see negative_cache.failure_class) showing that a source
+# does not serve an article. Timeouts, 429, 5xx and API key errors say
+# nothing about the prefix and are not counted.
+DEFINITIVE_FAILURES = ("forbidden", "not_found", "unavailable")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_stats (
+    prefix TEXT NOT NULL,
+    source TEXT NOT NULL,
+    successes INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0,
+    last_failure REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (prefix, source)
+) WITHOUT ROWID;
+"""
+
+
+def doi_prefix(doi: Optional[str]) -> Optional[str]:
+    """Get the registrant prefix of a DOI (e.g. ``10.1016``)."""
+    doi = normalize_doi(doi)
+    if not doi or "/" not in doi:
+        return None
+    return doi.split("/", 1)[0]
+
+
+class SourceRouter:
+    """Chooses which download sources to try for a DOI, and in what order.
+
+    Publisher sources (Elsevier, Springer) can only return their own
+    articles. For DOI prefixes in ``prefix_sources`` the owning publisher's
+    source is tried first and the other publisher sources are skipped. For
+    other prefixes the router learns from recorded outcomes: a publisher
+    source that has definitively failed (DEFINITIVE_FAILURES) ``min_attempts``
+    times for a prefix without a single success is skipped, and sources are
+    ordered by their success rate for the prefix. A skipped source is tried
+    again once ``retry_interval`` has passed since its last failure, so it
+    comes back if the publisher starts serving the prefix. Unpaywall is
+    never skipped. With a db_path the statistics persist across runs.
+
+    Example:
+        router = SourceRouter("data/pdfs/source_stats.db")
+        order = router.route("10.1016/j.x.2020.01.001", ["elsevier", "springer", "unpaywall"])
+        # ['elsevier', 'unpaywall']
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        prefix_sources: Optional[dict[str, str]] = None,
+        min_attempts: int = 5,
+        retry_interval: float = 7 * 86400
+    ):
+        """Initialize source router.
+
+        Args:
+            db_path: SQLite file for the learned statistics (created if
+                missing). None keeps them in memory for this run only.
+            prefix_sources: DOI prefix -> source overrides, merged into
+                DOI_PREFIX_SOURCES.
+            min_attempts: Failures without a success after which a publisher
+                source is skipped for an unknown prefix.
+            retry_interval: Seconds after the last failure before a skipped
+                source is tried again.
+        """
+        self.prefix_sources = {**DOI_PREFIX_SOURCES, **(prefix_sources or {})}
+        self.min_attempts = min_attempts
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        # (prefix, source) -> [successes, failures, last failure timestamp]
+        self._stats: dict[tuple[str, str], list] = {}
+
+        self.conn = None
+        if db_path is not None:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self.conn.executescript(SCHEMA)
+            for prefix, source, successes, failures, last_failure in self.conn.execute(
+                "SELECT prefix, source, successes, failures, last_failure FROM source_stats"
+            ):
+                self._stats[(prefix, source)] = [successes, failures, last_failure]
+
+    def close(self) -> None:
+        """Close the database connection, if any."""
+        if self.conn is not None:
+            self.conn.close()
+
+    def __enter__(self) -> "SourceRouter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def stats(self, doi: str, source: str) -> tuple[int, int]:
+        """Get (successes, failures) recorded for a source and a DOI's prefix."""
+        successes, failures, _ = self._stats.get((doi_prefix(doi), source), (0, 0, 0))
+        return successes, failures
+
+    def is_skipped(self, doi: str, source: str) -> bool:
+        """Whether a publisher source is currently skipped for a DOI's prefix.
+
+        Only applies to prefixes without a known owner (see route).
+        """
+        successes, failures, last_failure = self._stats.get(
+            (doi_prefix(doi), source), (0, 0, 0)
+        )
+        return (
+            successes == 0
+            and failures >= self.min_attempts
+            and time.time() - last_failure < self.retry_interval
+        )
+
+    def route(self, doi: str, sources: Sequence[str]) -> list[str]:
+        """Order and filter the sources to try for a DOI.
+
+        Args:
+            doi: Paper DOI.
+            sources: Enabled sources in default order.
+
+        Returns:
+            Sources to try, in order.
+        """
+        owner = self.prefix_sources.get(doi_prefix(doi))
+        routed = []
+        for source in sources:
+            if source in PUBLISHER_SOURCES:
+                if owner is not None and source != owner:
+                    continue
+                if owner is None and self.is_skipped(doi, source):
+                    continue
+            routed.append(source)
+
+        def rank(source: str) -> float:
+            if source == owner:
+                return -1.0
+            successes, failures = self.stats(doi, source)
+            attempts = successes + failures
+            return -(successes / attempts) if attempts else 0.0
+
+        return sorted(routed, key=rank)
+
+    def record(
+        self,
+        doi: str,
+        source: str,
+        success: bool,
+        outcome: str = "unavailable"
+    ) -> None:
+        """Record the outcome of trying a source for a DOI.
+
+        Args:
+            doi: Paper DOI.
+            source: Source name (e.g. "elsevier").
+            success: Whether the source returned a PDF.
+            outcome: Failure class of an unsuccessful attempt. Failures not
+                in DEFINITIVE_FAILURES are ignored.
+        """
+        prefix = doi_prefix(doi)
+        if prefix is None or (not success and outcome not in DEFINITIVE_FAILURES):
+            return
+
+        with self._lock:
+            counts = self._stats.setdefault((prefix, source), [0, 0, 0])
+            if success:
+                counts[0] += 1
+            else:
+                counts[1] += 1
+                counts[2] = time.time()
+            if self.conn is not None:
+                with self.conn:
+                    self.conn.execute(
+                        "INSERT INTO source_stats "
+                        "(prefix, source, successes, failures, last_failure) "
+                        "VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT (prefix, source) DO UPDATE SET "
+                        "successes = excluded.successes, failures = excluded.failures, "
+                        "last_failure = excluded.last_failure",
+                        (prefix, source, *counts)
+                    )
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Import src the same way the CLI scripts do
+sys.path.insert(0, str(Path(__file__).parent.parent))
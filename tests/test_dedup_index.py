@@ -0,0 +1,56 @@
+from src.dedup_index import DedupIndex, paper_keys
+from src.paper_fetcher import Paper
+
+
+def make_paper(scopus_id, title, doi=None):
+    return Paper(
+        scopus_id=scopus_id,
+        title=title,
+        abstract="",
+        authors=[],
+        publication_name="Journal",
+        publication_date="2024-01-01",
+        citation_count=0,
+        doi=doi,
+    )
+
+
+def test_same_title_different_doi_not_merged(tmp_path):
+    a = make_paper("1", "Editorial", "10.1/a")
+    b = make_paper("2", "Editorial", "10.1/b")
+
+    with DedupIndex(str(tmp_path / "index.db")) as index:
+        assert list(index.dedupe([a, b])) == [a, b]
+        assert index.find(b) == "2"
+        index.set_pdf_path(a, tmp_path / "a.pdf")
+        (tmp_path / "a.pdf").write_bytes(b"%PDF")
+        assert index.get_pdf_path(b) is None
+
+    # Also across runs, and when not registering
+    with DedupIndex(str(tmp_path / "index.db")) as index:
+        c = make_paper("3", "Editorial", "10.1/c")
+        assert list(index.dedupe([c], register=False)) == [c]
+        assert index.find(a) == "1"
+
+
+def test_same_title_without_conflicting_doi_merged(tmp_path):
+    a = make_paper("1", "Deep Learning for Graphs", "10.1/a")
+    no_doi = make_paper("2", "Deep learning for graphs.")
+    same_doi = make_paper("3", "Deep Learning for Graphs", "https://doi.org/10.1/A")
+
+    with DedupIndex(str(tmp_path / "index.db")) as index:
+        assert list(index.dedupe([a, no_doi, same_doi], register=False)) == [a]
+        assert list(index.dedupe([a, no_doi, same_doi])) == [a]
+        assert index.find(no_doi) == "1"
+        assert index.find(same_doi) == "1"
+
+
+def test_placeholder_title_has_no_title_key(tmp_path):
+    a = make_paper("1", "No title")
+    b = make_paper("2", "No title")
+    assert [kind for kind, _ in paper_keys(a)] == ["scopus_id"]
+
+    with DedupIndex(str(tmp_path / "index.db")) as index:
+        assert list(index.dedupe([a, b])) == [a, b]
+        assert index.add(b) == ("2", True)
+        assert len(index) == 2
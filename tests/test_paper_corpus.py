@@ -0,0 +1,69 @@
+import pytest
+
+from src import json_codec
+from src.paper_corpus import PaperCorpus
+from src.paper_io import JsonlPaperWriter, index_path, write_json_papers
+
+
+def make_records(n):
+    return [
+        {
+            "scopus_id": str(i),
+            "title": f"Paper {i} \"quoted\" [x]\nline",
+            "abstract": "Ünïcode {braces}",
+            "authors": [f"Author {i}"] if i % 2 else [],
+            "publication_name": "Journal",
+            "publication_date": "2024-01-01",
+            "citation_count": i,
+            "doi": f"10.1/{i}",
+            "keywords": [],
+            "url": None,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("indent", [False, True])
+@pytest.mark.parametrize("n", [0, 1, 3])
+def test_write_json_papers_matches_dump_file(tmp_path, indent, n):
+    metadata = {"query": "TITLE(x)", "fetched_at": "2024-01-01T00:00:00", "count": n}
+    records = make_records(n)
+
+    write_json_papers(tmp_path / "a.json", metadata, records, indent=indent)
+    json_codec.dump_file({**metadata, "papers": records}, tmp_path / "b.json", indent=indent)
+
+    assert (tmp_path / "a.json").read_bytes() == (tmp_path / "b.json").read_bytes()
+    with PaperCorpus(tmp_path / "a.json") as corpus:
+        assert corpus._records is None
+        assert [corpus.record(i) for i in range(len(corpus))] == records
+        assert corpus.metadata["query"] == "TITLE(x)"
+
+
+def test_json_without_index_is_parsed_in_full(tmp_path):
+    records = make_records(3)
+    filepath = tmp_path / "papers.json"
+    json_codec.dump_file({"query": "q", "papers": records}, filepath, indent=True)
+
+    with PaperCorpus(filepath) as corpus:
+        assert corpus[1].scopus_id == "1"
+        assert corpus.metadata["count"] == 3
+    assert not index_path(filepath).exists()
+
+
+def test_jsonl_writer_saves_index(tmp_path):
+    records = make_records(3)
+    filepath = tmp_path / "papers.jsonl"
+    with JsonlPaperWriter(filepath, "q") as writer:
+        for record in records:
+            writer.write(record)
+
+    assert index_path(filepath).exists()
+    with PaperCorpus(filepath) as corpus:
+        assert [corpus.record(i) for i in range(len(corpus))] == records
+        assert corpus[-1].scopus_id == "2"
+
+    # A stale index is ignored and rebuilt from the lines
+    with open(filepath, "ab") as f:
+        f.write(json_codec.dumps(make_records(4)[3]) + b"\n")
+    with PaperCorpus(filepath) as corpus:
+        assert len(corpus) == 4